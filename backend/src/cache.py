@@ -0,0 +1,64 @@
+# =============================================================================
+# Amazon Reviews Scraper - In-Process Response Cache
+# =============================================================================
+# Purpose: Short-TTL caching for polled, low-volatility endpoints
+# Public API: TTLCache, dashboard_cache, scan_summary_cache
+# Dependencies: none
+# =============================================================================
+
+import threading
+import time
+from typing import Any, Callable, Dict, Tuple
+
+
+class TTLCache:
+    """
+    Minimal thread-safe key/value cache with per-entry expiry.
+
+    Values live in this process only; with several uvicorn workers each
+    keeps its own copy, which is fine for data that is allowed to be a few
+    seconds stale.
+    """
+
+    def __init__(self):
+        self._entries: Dict[str, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get_or_set(self, key: str, ttl_seconds: float, compute: Callable[[], Any]) -> Any:
+        """
+        Return the cached value for key, computing and storing it if stale.
+
+        Args:
+            key: Cache key
+            ttl_seconds: How long a computed value stays valid
+            compute: Zero-argument callable producing the value
+
+        Returns:
+            Cached or freshly computed value
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry and now < entry[0]:
+            return entry[1]
+
+        value = compute()
+        with self._lock:
+            # Drop expired entries so keys that embed a version do not pile up
+            self._entries = {
+                k: e for k, e in self._entries.items() if now < e[0]
+            }
+            self._entries[key] = (now + ttl_seconds, value)
+        return value
+
+    def clear(self) -> None:
+        """Drop all entries so the next read recomputes."""
+        with self._lock:
+            self._entries.clear()
+
+
+# Dashboard and queue status; cleared by the worker when a job finishes
+dashboard_cache = TTLCache()
+
+# Product scan result summaries, keyed by job progress (see product_scans.router)
+scan_summary_cache = TTLCache()
@@ -75,6 +75,12 @@ class ChannelSku(Base):
 
     # Composite unique constraint
     __table_args__ = (
+        Index(
+            "unique_channel_sku_marketplace",
+            "channel_sku_code",
+            "marketplace",
+            unique=True,
+        ),
         Index("idx_channel_sku_sku_id", "sku_id"),
         Index("idx_channel_sku_rating", "latest_rating"),
         Index("idx_channel_sku_marketplace", "marketplace"),
@@ -10,10 +10,9 @@ from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
 from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-import io
-import csv
 
 from ..database import get_db
+from ..exports import iter_csv
 from ..pagination import PaginationParams, get_pagination_params, create_paginated_response
 from .service import ChannelSkuService
 from .schemas import (
@@ -121,12 +120,7 @@ async def export_channel_skus_csv(
     service = ChannelSkuService(db)
     items, _ = service.list_all(offset=0, limit=10000, marketplace=marketplace, sku_code=sku_code)
 
-    # Create CSV in memory
-    output = io.StringIO()
-    writer = csv.writer(output)
-
-    # Header
-    writer.writerow([
+    header = [
         "Channel SKU",
         "Marketplace",
         "ASIN",
@@ -135,11 +129,9 @@ async def export_channel_skus_csv(
         "Review Count",
         "Last Scraped",
         "Parent SKU",
-    ])
-
-    # Data rows
-    for item in items:
-        writer.writerow([
+    ]
+    rows = (
+        [
             item.channel_sku_code,
             item.marketplace,
             item.current_asin,
@@ -148,11 +140,13 @@ async def export_channel_skus_csv(
             str(item.latest_review_count) if item.latest_review_count else "",
             item.last_scraped_at.isoformat() if item.last_scraped_at else "",
             item.sku.sku_code if item.sku else "",
-        ])
+        ]
+        for item in items
+    )
 
-    output.seek(0)
+    # Encoded in chunks as the response is sent, not built up front
     return StreamingResponse(
-        iter([output.getvalue()]),
+        iter_csv(header, rows),
         media_type="text/csv",
         headers={"Content-Disposition": "attachment; filename=channel_skus.csv"},
     )
@@ -6,9 +6,10 @@
 # Dependencies: sqlalchemy, models, schemas
 # =============================================================================
 
-from typing import Optional, List, Tuple
+from typing import Dict, Iterable, Optional, List, Tuple
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import func, or_
+from sqlalchemy import and_, bindparam, exists, func, insert, or_, select, update
+from sqlalchemy.dialects.mysql import insert as mysql_insert
 
 from .models import ChannelSku, ChannelSkuAsinHistory
 from ..skus.models import Sku
@@ -46,6 +47,41 @@ class ChannelSkuService:
         self.db.flush()  # Get ID without committing
         return new_sku.id
 
+    def get_or_create_sku_ids(self, sku_codes: Iterable[str]) -> Dict[str, int]:
+        """
+        Resolve many SKU codes to IDs, creating missing SKUs.
+
+        One IN query for existing codes, one executemany insert for the
+        missing ones and one IN query for their IDs. Does not commit.
+        Lookups ignore case, as the MySQL collation does.
+
+        Args:
+            sku_codes: SKU codes to find or create
+
+        Returns:
+            Dict mapping each given code to its SKU ID
+        """
+        codes = set(sku_codes)
+        if not codes:
+            return {}
+
+        ids = self._sku_ids_by_lower_code(codes)
+        missing = {}
+        for code in codes:
+            missing.setdefault(code.lower(), code)
+        for key in ids:
+            missing.pop(key, None)
+        if missing:
+            self.db.execute(insert(Sku), [{"sku_code": c} for c in missing.values()])
+            ids.update(self._sku_ids_by_lower_code(missing.values()))
+
+        return {code: ids[code.lower()] for code in codes}
+
+    def _sku_ids_by_lower_code(self, codes: Iterable[str]) -> Dict[str, int]:
+        """Map lower-cased SKU codes to IDs for existing SKUs."""
+        rows = self.db.query(Sku.sku_code, Sku.id).filter(Sku.sku_code.in_(list(codes)))
+        return {code.lower(): sku_id for code, sku_id in rows}
+
     # ===== Create Operations =====
 
     def create(
@@ -149,6 +185,88 @@ class ChannelSkuService:
         self.db.commit()
         return created, skipped, errors
 
+    def get_or_create_many(
+        self,
+        listings: List[dict],
+        marketplace: str,
+        sku_ids: Dict[str, int],
+    ) -> Dict[str, int]:
+        """
+        Resolve listings to Channel SKU IDs in one marketplace, creating
+        missing Channel SKUs (with initial ASIN history) in bulk.
+
+        Existing Channel SKUs without a parent are linked to the listing's
+        SKU. Runs three statements whatever the number of listings: an
+        INSERT ... ON DUPLICATE KEY UPDATE on the (code, marketplace)
+        unique key, an INSERT ... SELECT for the new rows' ASIN history and
+        one IN query for the IDs. Does not commit. Lookups ignore case, as
+        the MySQL collation does.
+
+        Args:
+            listings: Dicts with channel_sku_code, asin and optional sku_code
+            marketplace: Amazon marketplace code
+            sku_ids: SKU code -> ID mapping for the listings' sku_code values
+
+        Returns:
+            Dict mapping each listing's channel_sku_code to its Channel SKU ID
+        """
+        # First listing per code supplies the ASIN; any listing may supply
+        # the parent SKU
+        wanted = {}
+        for listing in listings:
+            code = listing["channel_sku_code"]
+            entry = wanted.setdefault(
+                code.lower(), {"code": code, "asin": listing["asin"], "sku_id": None}
+            )
+            if entry["sku_id"] is None and listing.get("sku_code"):
+                entry["sku_id"] = sku_ids[listing["sku_code"]]
+        if not wanted:
+            return {}
+        codes = [entry["code"] for entry in wanted.values()]
+
+        # Existing rows keep their ASIN and parent; only a missing parent
+        # is filled in
+        stmt = mysql_insert(ChannelSku).values([
+            {
+                "channel_sku_code": entry["code"],
+                "marketplace": marketplace,
+                "current_asin": entry["asin"],
+                "sku_id": entry["sku_id"],
+            }
+            for entry in wanted.values()
+        ])
+        stmt = stmt.on_duplicate_key_update(
+            sku_id=func.coalesce(ChannelSku.sku_id, stmt.inserted.sku_id)
+        )
+        self.db.execute(stmt)
+
+        # Every create path records the initial ASIN, so rows without any
+        # history are the ones just inserted
+        in_listings = and_(
+            ChannelSku.marketplace == marketplace,
+            ChannelSku.channel_sku_code.in_(codes),
+        )
+        self.db.execute(
+            insert(ChannelSkuAsinHistory).from_select(
+                ["channel_sku_id", "asin"],
+                select(ChannelSku.id, ChannelSku.current_asin).where(
+                    in_listings,
+                    ~exists().where(ChannelSkuAsinHistory.channel_sku_id == ChannelSku.id),
+                ),
+            )
+        )
+
+        ids = {
+            code.lower(): channel_sku_id
+            for channel_sku_id, code in self.db.query(
+                ChannelSku.id, ChannelSku.channel_sku_code
+            ).filter(in_listings)
+        }
+        return {
+            listing["channel_sku_code"]: ids[listing["channel_sku_code"].lower()]
+            for listing in listings
+        }
+
     # ===== Read Operations =====
 
     def get_by_id(self, channel_sku_id: int) -> Optional[ChannelSku]:
@@ -355,6 +473,71 @@ class ChannelSkuService:
         self.db.refresh(channel_sku)
         return channel_sku
 
+    def update_metrics_many(
+        self,
+        results: List[dict],
+        job_id: Optional[int] = None,
+    ) -> None:
+        """
+        Apply a batch of scan results to their Channel SKUs.
+
+        Batch form of update_metrics: one IN query for the current ASINs,
+        one executemany UPDATE and one insert for any ASIN changes. Does
+        not commit.
+
+        Args:
+            results: Mappings with ``id``, ``rating``, ``review_count``,
+                ``title`` and ``scraped_asin``
+            job_id: Product scan job ID
+        """
+        if not results:
+            return
+
+        current_asins = dict(
+            self.db.query(ChannelSku.id, ChannelSku.current_asin)
+            .filter(ChannelSku.id.in_({r["id"] for r in results}))
+            .all()
+        )
+        results = [r for r in results if r["id"] in current_asins]
+        if not results:
+            return
+
+        # Empty titles/ASINs keep the stored value, as in update_metrics
+        table = ChannelSku.__table__
+        self.db.execute(
+            update(table)
+            .where(table.c.id == bindparam("b_id"))
+            .values(
+                latest_rating=bindparam("b_rating"),
+                latest_review_count=bindparam("b_review_count"),
+                last_scraped_at=func.current_timestamp(),
+                product_title=func.coalesce(bindparam("b_title"), table.c.product_title),
+                current_asin=func.coalesce(bindparam("b_asin"), table.c.current_asin),
+            ),
+            [
+                {
+                    "b_id": r["id"],
+                    "b_rating": r["rating"],
+                    "b_review_count": r["review_count"],
+                    "b_title": r["title"] or None,
+                    "b_asin": r["scraped_asin"] or None,
+                }
+                for r in results
+            ],
+        )
+
+        changed = [
+            {
+                "channel_sku_id": r["id"],
+                "asin": r["scraped_asin"],
+                "changed_by_job_id": job_id,
+            }
+            for r in results
+            if r["scraped_asin"] and r["scraped_asin"] != current_asins[r["id"]]
+        ]
+        if changed:
+            self.db.execute(insert(ChannelSkuAsinHistory), changed)
+
     # ===== Delete Operations =====
 
     def delete(self, channel_sku: ChannelSku) -> None:
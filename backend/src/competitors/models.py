@@ -20,9 +20,9 @@ from sqlalchemy import (
     ForeignKey,
     Enum,
     Index,
+    JSON,
     func,
 )
-from sqlalchemy.dialects.mysql import LONGTEXT
 from sqlalchemy.orm import relationship
 
 from ..database import Base
@@ -104,6 +104,16 @@ class Competitor(Base):
     __table_args__ = (
         Index("idx_competitor_sku_id", "sku_id"),
         Index("idx_competitor_schedule", "schedule", "next_scrape_at"),
+        # Covers the dashboard's upcoming-scrapes query (filter + ORDER BY +
+        # selected columns) so it never touches the clustered index
+        Index(
+            "idx_competitor_upcoming",
+            "is_active",
+            "next_scrape_at",
+            "schedule",
+            "asin",
+            "marketplace",
+        ),
         Index("idx_competitor_active", "is_active"),
         Index("idx_competitor_marketplace", "marketplace"),
         Index(
@@ -176,17 +186,19 @@ class CompetitorData(Base):
     fulfilled_by = Column(String(255), nullable=True)
     seller_id = Column(String(50), nullable=True)
     is_prime = Column(Boolean, default=False)
-    features = Column(LONGTEXT, nullable=True)  # JSON stored as text for PyMySQL
+    # none_as_null: a Python None is stored as SQL NULL, not the JSON literal
+    # null, so "IS NULL" filters keep matching fields the scraper left empty
+    features = Column(JSON(none_as_null=True), nullable=True)
     product_description = Column(Text, nullable=True)
     main_image_url = Column(String(500), nullable=True)
-    images = Column(LONGTEXT, nullable=True)  # JSON stored as text for PyMySQL
-    videos = Column(LONGTEXT, nullable=True)  # JSON stored as text for PyMySQL
-    categories = Column(LONGTEXT, nullable=True)  # JSON stored as text for PyMySQL
-    variations = Column(LONGTEXT, nullable=True)  # JSON stored as text for PyMySQL
+    images = Column(JSON(none_as_null=True), nullable=True)
+    videos = Column(JSON(none_as_null=True), nullable=True)
+    categories = Column(JSON(none_as_null=True), nullable=True)
+    variations = Column(JSON(none_as_null=True), nullable=True)
     variations_count = Column(Integer, default=0)
-    product_details = Column(LONGTEXT, nullable=True)  # JSON stored as text for PyMySQL
-    review_insights = Column(LONGTEXT, nullable=True)  # JSON stored as text for PyMySQL
-    raw_data = Column(LONGTEXT, nullable=True)  # JSON stored as text for PyMySQL
+    product_details = Column(JSON(none_as_null=True), nullable=True)
+    review_insights = Column(JSON(none_as_null=True), nullable=True)
+    raw_data = Column(JSON(none_as_null=True), nullable=True)
     scraped_at = Column(TIMESTAMP, server_default=func.current_timestamp())
     created_at = Column(TIMESTAMP, server_default=func.current_timestamp())
     updated_at = Column(
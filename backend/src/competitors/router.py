@@ -6,16 +6,17 @@
 # Dependencies: fastapi, service, schemas
 # =============================================================================
 
-import csv
-import io
 from datetime import datetime
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from sqlalchemy.orm import Session
 
+from ..cache import dashboard_cache
+from ..config import settings
 from ..database import get_db
+from ..exports import accepts_gzip, gzip_stream, iter_csv, iter_parquet, parquet_available
 from ..pagination import calculate_pages
 from .dependencies import valid_competitor, valid_keyword, valid_scrape_job
 from .models import Competitor, CompetitorKeyword, CompetitorScrapeJob
@@ -39,13 +40,21 @@ from .schemas import (
     PriceHistoryResponse,
     PriceHistoryListResponse,
     PriceChangeResponse,
+    UpcomingScrapeResponse,
     DashboardStats,
     ParentSkuStats,
     ParentSkuListResponse,
 )
 from .service import CompetitorService
 
-router = APIRouter(prefix="/api/competitors", tags=["Competitors"])
+# orjson serializes the large competitor/scrape-job payloads much faster than
+# the stdlib encoder; Decimal/datetime are already converted by FastAPI's
+# response validation before they reach the response class.
+router = APIRouter(
+    prefix="/api/competitors",
+    tags=["Competitors"],
+    default_response_class=ORJSONResponse,
+)
 
 
 # =============================================================================
@@ -54,8 +63,24 @@ router = APIRouter(prefix="/api/competitors", tags=["Competitors"])
 
 
 @router.get("/dashboard/stats", response_model=DashboardStats)
-def get_dashboard_stats(db: Session = Depends(get_db)):
-    """Get global dashboard statistics."""
+def get_dashboard_stats(
+    fresh: bool = Query(False, description="Bypass the cached stats"),
+    db: Session = Depends(get_db),
+):
+    """Get global dashboard statistics (cached for a short TTL)."""
+    # The dashboard polls this endpoint and doesn't need second-level
+    # freshness; the worker clears dashboard_cache when a job finishes
+    if fresh:
+        return _compute_dashboard_stats(db)
+    return dashboard_cache.get_or_set(
+        "competitor_stats",
+        settings.dashboard_stats_ttl_seconds,
+        lambda: _compute_dashboard_stats(db),
+    )
+
+
+def _compute_dashboard_stats(db: Session) -> DashboardStats:
+    """Build the dashboard stats response from the database."""
     stats = CompetitorService.get_global_stats(db)
 
     # Convert objects to serializable format
@@ -67,16 +92,20 @@ def get_dashboard_stats(db: Session = Depends(get_db)):
         competitors_by_marketplace=stats["competitors_by_marketplace"],
         recent_price_changes=stats["recent_price_changes"],  # Already dict format
         upcoming_scrapes=[
-            _competitor_to_response(c).model_dump()
+            UpcomingScrapeResponse.model_validate(c)
             for c in stats["upcoming_scrapes"]
         ],
     )
 
 
 @router.get("/dashboard/by-sku/{sku_id}", response_model=ParentSkuStats)
-def get_sku_stats(sku_id: int, db: Session = Depends(get_db)):
+def get_sku_stats(
+    sku_id: int,
+    include_rows: bool = Query(True, description="Include competitor and keyword lists"),
+    db: Session = Depends(get_db),
+):
     """Get statistics for a specific parent SKU."""
-    stats = CompetitorService.get_parent_sku_stats(db, sku_id)
+    stats = CompetitorService.get_parent_sku_stats(db, sku_id, include_rows=include_rows)
     if not stats:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -95,7 +124,7 @@ def get_sku_stats(sku_id: int, db: Session = Depends(get_db)):
         max_competitor_price=stats["max_competitor_price"],
         avg_competitor_rating=stats["avg_competitor_rating"],
         competitors=[_competitor_to_response(c) for c in stats["competitors"]],
-        keywords=[_keyword_to_response(k) for k in stats["keywords"]],
+        keywords=[_keyword_to_response(k, cs, cc) for k, cs, cc in stats["keywords"]],
     )
 
 
@@ -156,7 +185,7 @@ def list_keywords(
     )
 
     return KeywordListResponse(
-        items=[_keyword_to_response(k) for k in items],
+        items=[_keyword_to_response(k, cs, cc) for k, cs, cc in items],
         total=total,
         page=page,
         per_page=per_page,
@@ -170,7 +199,8 @@ def list_keywords(
 def create_keyword(data: KeywordCreate, db: Session = Depends(get_db)):
     """Create a new keyword."""
     keyword = CompetitorService.create_keyword(db, data)
-    return _keyword_to_response(keyword)
+    # A new keyword has no links yet; skip loading the empty collections
+    return _keyword_to_response(keyword, 0, 0)
 
 
 @router.get("/keywords/{keyword_id}", response_model=KeywordDetailResponse)
@@ -275,12 +305,19 @@ def list_scrape_jobs(
     page: int = Query(1, ge=1),
     per_page: int = Query(50, ge=1, le=100),
     status_filter: Optional[str] = Query(None, alias="status"),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from a previous page"),
     db: Session = Depends(get_db),
 ):
     """List competitor scrape jobs."""
-    items, total = CompetitorService.list_scrape_jobs(
-        db, page=page, per_page=per_page, status=status_filter
-    )
+    try:
+        items, total, next_cursor = CompetitorService.list_scrape_jobs(
+            db, page=page, per_page=per_page, status=status_filter, cursor=cursor
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
 
     return ScrapeJobListResponse(
         items=[ScrapeJobResponse.model_validate(j) for j in items],
@@ -288,6 +325,7 @@ def list_scrape_jobs(
         page=page,
         per_page=per_page,
         pages=calculate_pages(total, per_page),
+        next_cursor=next_cursor,
     )
 
 
@@ -354,8 +392,20 @@ def cancel_scrape_job(
 # =============================================================================
 
 
+def _csv_response(request: Request, header: list, rows: list, filename: str) -> StreamingResponse:
+    """Stream CSV rows, gzip-compressed when the client accepts it."""
+    body = iter_csv(header, rows)
+    headers = {"Content-Disposition": f"attachment; filename={filename}"}
+    if accepts_gzip(request):
+        body = gzip_stream(body)
+        headers["Content-Encoding"] = "gzip"
+        headers["Vary"] = "Accept-Encoding"
+    return StreamingResponse(body, media_type="text/csv", headers=headers)
+
+
 @router.get("/export/csv")
 def export_competitors_csv(
+    request: Request,
     marketplace: Optional[str] = None,
     sku_id: Optional[int] = None,
     db: Session = Depends(get_db),
@@ -365,53 +415,53 @@ def export_competitors_csv(
         db, page=1, per_page=10000, marketplace=marketplace, sku_id=sku_id
     )
 
-    output = io.StringIO()
-    writer = csv.writer(output)
-    writer.writerow(
-        [
-            "ASIN",
-            "Marketplace",
-            "Display Name",
-            "Parent SKU",
-            "Pack Size",
-            "Price",
-            "Unit Price",
-            "Rating",
-            "Review Count",
-            "Schedule",
-            "Active",
-        ]
-    )
-
+    header = [
+        "ASIN",
+        "Marketplace",
+        "Display Name",
+        "Parent SKU",
+        "Pack Size",
+        "Price",
+        "Unit Price",
+        "Rating",
+        "Review Count",
+        "Schedule",
+        "Active",
+    ]
+
+    # Rows are built before returning: the DB session closes once the
+    # endpoint returns, before the response body is streamed
+    rows = []
     for comp in items:
-        writer.writerow(
+        d = comp.data
+        sku = comp.sku
+        rows.append(
             [
                 comp.asin,
                 comp.marketplace,
                 comp.display_name or "",
-                comp.sku.sku_code if comp.sku else "",
+                sku.sku_code if sku else "",
                 comp.pack_size or 1,
-                comp.data.price if comp.data else "",
-                comp.data.unit_price if comp.data else "",
-                comp.data.rating if comp.data else "",
-                comp.data.review_count if comp.data else "",
+                d.price if d else "",
+                d.unit_price if d else "",
+                d.rating if d else "",
+                d.review_count if d else "",
                 comp.schedule,
                 "Yes" if comp.is_active else "No",
             ]
         )
 
-    output.seek(0)
-    return StreamingResponse(
-        iter([output.getvalue()]),
-        media_type="text/csv",
-        headers={
-            "Content-Disposition": f"attachment; filename=competitors_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-        },
+    return _csv_response(
+        request,
+        header,
+        rows,
+        f"competitors_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
     )
 
 
 @router.get("/export/price-changer")
 def export_for_price_changer(
+    request: Request,
     marketplace: Optional[str] = None,
     sku_id: Optional[int] = None,
     db: Session = Depends(get_db),
@@ -426,47 +476,113 @@ def export_for_price_changer(
         is_active=True,
     )
 
-    output = io.StringIO()
-    writer = csv.writer(output)
-    writer.writerow(
-        [
-            "ASIN",
-            "Marketplace",
-            "Competitor Name",
-            "Parent SKU",
-            "Price",
-            "Unit Price",
-            "Pack Size",
-            "Rating",
-            "Review Count",
-            "Availability",
-            "Scraped At",
-        ]
+    header = [
+        "ASIN",
+        "Marketplace",
+        "Competitor Name",
+        "Parent SKU",
+        "Price",
+        "Unit Price",
+        "Pack Size",
+        "Rating",
+        "Review Count",
+        "Availability",
+        "Scraped At",
+    ]
+
+    # Rows are built before returning: the DB session closes once the
+    # endpoint returns, before the response body is streamed
+    rows = []
+    for comp in items:
+        d = comp.data
+        sku = comp.sku
+        rows.append(
+            [
+                comp.asin,
+                comp.marketplace,
+                comp.display_name or comp.asin,
+                sku.sku_code if sku else "",
+                d.price if d else "",
+                d.unit_price if d else "",
+                comp.pack_size or 1,
+                d.rating if d else "",
+                d.review_count if d else "",
+                d.availability if d else "",
+                d.scraped_at.isoformat() if d else "",
+            ]
+        )
+
+    return _csv_response(
+        request,
+        header,
+        rows,
+        f"price_changer_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+    )
+
+
+@router.get("/export/parquet")
+def export_competitors_parquet(
+    marketplace: Optional[str] = None,
+    sku_id: Optional[int] = None,
+    db: Session = Depends(get_db),
+):
+    """Export competitors to Parquet for analytics tooling."""
+    if not parquet_available():
+        raise HTTPException(
+            status_code=status.HTTP_501_NOT_IMPLEMENTED,
+            detail="Parquet export requires pyarrow to be installed",
+        )
+
+    items, _ = CompetitorService.list_all(
+        db, page=1, per_page=10000, marketplace=marketplace, sku_id=sku_id
     )
 
+    columns = [
+        ("asin", "string"),
+        ("marketplace", "string"),
+        ("display_name", "string"),
+        ("parent_sku", "string"),
+        ("pack_size", "int64"),
+        ("price", "double"),
+        ("unit_price", "double"),
+        ("rating", "double"),
+        ("review_count", "int64"),
+        ("availability", "string"),
+        ("schedule", "string"),
+        ("is_active", "bool"),
+        ("scraped_at", "timestamp[s]"),
+    ]
+
+    def to_float(value):
+        return float(value) if value is not None else None
+
+    rows = []
     for comp in items:
-        writer.writerow(
+        d = comp.data
+        sku = comp.sku
+        rows.append(
             [
                 comp.asin,
                 comp.marketplace,
-                comp.display_name or comp.asin,
-                comp.sku.sku_code if comp.sku else "",
-                comp.data.price if comp.data else "",
-                comp.data.unit_price if comp.data else "",
+                comp.display_name,
+                sku.sku_code if sku else None,
                 comp.pack_size or 1,
-                comp.data.rating if comp.data else "",
-                comp.data.review_count if comp.data else "",
-                comp.data.availability if comp.data else "",
-                comp.data.scraped_at.isoformat() if comp.data else "",
+                to_float(d.price) if d else None,
+                to_float(d.unit_price) if d else None,
+                to_float(d.rating) if d else None,
+                d.review_count if d else None,
+                d.availability if d else None,
+                comp.schedule,
+                bool(comp.is_active),
+                d.scraped_at if d else None,
             ]
         )
 
-    output.seek(0)
     return StreamingResponse(
-        iter([output.getvalue()]),
-        media_type="text/csv",
+        iter_parquet(columns, rows),
+        media_type="application/vnd.apache.parquet",
         headers={
-            "Content-Disposition": f"attachment; filename=price_changer_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+            "Content-Disposition": f"attachment; filename=competitors_{datetime.now().strftime('%Y%m%d_%H%M%S')}.parquet"
         },
     )
 
@@ -496,8 +612,11 @@ def list_competitors(
         marketplace=marketplace,
         is_active=is_active,
         search=search,
+        include_data=include_data,
     )
 
+    pages = calculate_pages(total, per_page)
+
     # Use detail response if data is requested (returns CompetitorDetailResponse with data field)
     if include_data:
         return {
@@ -505,7 +624,7 @@ def list_competitors(
             "total": total,
             "page": page,
             "per_page": per_page,
-            "pages": calculate_pages(total, per_page),
+            "pages": pages,
         }
 
     return CompetitorListResponse(
@@ -513,29 +632,21 @@ def list_competitors(
         total=total,
         page=page,
         per_page=per_page,
-        pages=calculate_pages(total, per_page),
+        pages=pages,
     )
 
 
 @router.post("", response_model=CompetitorResponse, status_code=status.HTTP_201_CREATED)
 def create_competitor(data: CompetitorCreate, db: Session = Depends(get_db)):
     """Create a new competitor."""
-    # Check for duplicate
-    existing = (
-        db.query(Competitor)
-        .filter(
-            Competitor.asin == data.asin.upper(),
-            Competitor.marketplace == data.marketplace.lower(),
-        )
-        .first()
-    )
-    if existing:
+    # Duplicates are rejected by the unique (asin, marketplace) index
+    try:
+        competitor = CompetitorService.create(db, data)
+    except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
-            detail=f"Competitor with ASIN {data.asin} in marketplace {data.marketplace} already exists",
+            detail=str(e),
         )
-
-    competitor = CompetitorService.create(db, data)
     return _competitor_to_response(competitor)
 
 
@@ -599,17 +710,25 @@ def get_price_history(
     per_page: int = Query(50, ge=1, le=100),
     start_date: Optional[datetime] = None,
     end_date: Optional[datetime] = None,
+    cursor: Optional[str] = Query(None, description="Keyset cursor from a previous page"),
     db: Session = Depends(get_db),
 ):
     """Get price history for a competitor."""
-    items, total = CompetitorService.get_price_history(
-        db,
-        competitor.id,
-        page=page,
-        per_page=per_page,
-        start_date=start_date,
-        end_date=end_date,
-    )
+    try:
+        items, total, next_cursor = CompetitorService.get_price_history(
+            db,
+            competitor.id,
+            page=page,
+            per_page=per_page,
+            start_date=start_date,
+            end_date=end_date,
+            cursor=cursor,
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
 
     return PriceHistoryListResponse(
         items=[PriceHistoryResponse.model_validate(h) for h in items],
@@ -617,6 +736,7 @@ def get_price_history(
         page=page,
         per_page=per_page,
         pages=calculate_pages(total, per_page),
+        next_cursor=next_cursor,
     )
 
 
@@ -674,8 +794,22 @@ def _competitor_to_detail_response(
     )
 
 
-def _keyword_to_response(keyword: CompetitorKeyword) -> KeywordResponse:
-    """Convert Keyword model to response schema."""
+def _keyword_to_response(
+    keyword: CompetitorKeyword,
+    linked_channel_skus_count: Optional[int] = None,
+    linked_competitors_count: Optional[int] = None,
+) -> KeywordResponse:
+    """
+    Convert Keyword model to response schema.
+
+    Link counts precomputed in SQL are used when given; otherwise the link
+    collections are loaded and counted.
+    """
+    if linked_channel_skus_count is None:
+        linked_channel_skus_count = len(keyword.channel_sku_links)
+    if linked_competitors_count is None:
+        linked_competitors_count = len(keyword.competitor_links)
+
     return KeywordResponse(
         id=keyword.id,
         sku_id=keyword.sku_id,
@@ -685,8 +819,8 @@ def _keyword_to_response(keyword: CompetitorKeyword) -> KeywordResponse:
         created_at=keyword.created_at,
         updated_at=keyword.updated_at,
         sku_code=keyword.sku.sku_code if keyword.sku else None,
-        linked_channel_skus_count=len(keyword.channel_sku_links),
-        linked_competitors_count=len(keyword.competitor_links),
+        linked_channel_skus_count=linked_channel_skus_count,
+        linked_competitors_count=linked_competitors_count,
     )
 
 
@@ -8,12 +8,16 @@
 
 from datetime import datetime
 from decimal import Decimal
-from typing import Optional, List, Any
+from typing import Annotated, Optional, List, Any
 from enum import Enum
 
-import json
-
-from pydantic import BaseModel, Field, ConfigDict, field_validator
+from pydantic import (
+    BaseModel,
+    BeforeValidator,
+    ConfigDict,
+    Field,
+    StringConstraints,
+)
 
 
 # =============================================================================
@@ -30,6 +34,35 @@ class ScheduleType(str, Enum):
     MONTHLY = "monthly"
 
 
+# Schedule fields are plain strings validated by set membership; ScheduleType
+# remains the constants namespace for callers.
+_SCHEDULE_VALUES = frozenset(s.value for s in ScheduleType)
+
+
+def _check_schedule(v):
+    """Reject schedule values that aren't a known ScheduleType string."""
+    if not isinstance(v, str) or v not in _SCHEDULE_VALUES:
+        raise ValueError(f"Invalid schedule: {v!r}")
+    return v
+
+
+def _schedule_json_schema(schema: dict) -> None:
+    """Publish the allowed schedule values in the OpenAPI schema."""
+    schema["enum"] = [s.value for s in ScheduleType]
+
+
+ScheduleValue = Annotated[
+    str,
+    BeforeValidator(_check_schedule),
+    Field(json_schema_extra=_schedule_json_schema),
+]
+
+# ASINs and marketplace codes are normalized by pydantic-core on input, so
+# services can compare and store them without re-normalizing.
+AsinValue = Annotated[str, StringConstraints(to_upper=True)]
+MarketplaceValue = Annotated[str, StringConstraints(to_lower=True)]
+
+
 class JobStatus(str, Enum):
     QUEUED = "queued"
     RUNNING = "running"
@@ -59,8 +92,8 @@ class ItemStatus(str, Enum):
 class CompetitorBase(BaseModel):
     """Base schema for competitor."""
 
-    asin: str = Field(..., min_length=10, max_length=15)
-    marketplace: str = Field(default="com", max_length=10)
+    asin: AsinValue = Field(..., min_length=10, max_length=15)
+    marketplace: MarketplaceValue = Field(default="com", max_length=10)
     pack_size: Optional[int] = Field(default=1, ge=1)
     display_name: Optional[str] = Field(default=None, max_length=255)
     notes: Optional[str] = None
@@ -70,7 +103,7 @@ class CompetitorCreate(CompetitorBase):
     """Schema for creating a competitor."""
 
     sku_id: Optional[int] = None
-    schedule: ScheduleType = ScheduleType.NONE
+    schedule: ScheduleValue = "none"
 
 
 class CompetitorBulkCreate(BaseModel):
@@ -85,7 +118,7 @@ class CompetitorUpdate(BaseModel):
     sku_id: Optional[int] = None
     pack_size: Optional[int] = Field(default=None, ge=1)
     display_name: Optional[str] = Field(default=None, max_length=255)
-    schedule: Optional[ScheduleType] = None
+    schedule: Optional[ScheduleValue] = None
     is_active: Optional[bool] = None
     notes: Optional[str] = None
 
@@ -93,7 +126,7 @@ class CompetitorUpdate(BaseModel):
 class CompetitorScheduleUpdate(BaseModel):
     """Schema for updating competitor schedule."""
 
-    schedule: ScheduleType
+    schedule: ScheduleValue
 
 
 class CompetitorResponse(CompetitorBase):
@@ -165,28 +198,6 @@ class CompetitorDataResponse(BaseModel):
     review_insights: Optional[Any] = None
     scraped_at: datetime
 
-    @field_validator(
-        "features",
-        "images",
-        "videos",
-        "categories",
-        "variations",
-        "product_details",
-        "review_insights",
-        mode="before",
-    )
-    @classmethod
-    def parse_json_string(cls, v):
-        """Parse JSON string to Python object if needed."""
-        if v is None:
-            return None
-        if isinstance(v, str):
-            try:
-                return json.loads(v)
-            except (json.JSONDecodeError, TypeError):
-                return v
-        return v
-
 
 class CompetitorDetailResponse(CompetitorResponse):
     """Full competitor detail with scraped data."""
@@ -222,6 +233,8 @@ class PriceHistoryListResponse(BaseModel):
     total: int
     page: int
     per_page: int
+    pages: int
+    next_cursor: Optional[str] = None
 
 
 class PriceChangeResponse(BaseModel):
@@ -236,6 +249,18 @@ class PriceChangeResponse(BaseModel):
     recorded_at: datetime
 
 
+class UpcomingScrapeResponse(BaseModel):
+    """Scheduled competitor shown in the dashboard's upcoming scrapes."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    asin: str
+    marketplace: str
+    schedule: str
+    next_scrape_at: datetime
+
+
 # =============================================================================
 # Keyword Schemas
 # =============================================================================
@@ -245,7 +270,7 @@ class KeywordBase(BaseModel):
     """Base schema for keyword."""
 
     keyword: str = Field(..., min_length=1, max_length=255)
-    marketplace: str = Field(default="com", max_length=10)
+    marketplace: MarketplaceValue = Field(default="com", max_length=10)
     notes: Optional[str] = None
 
 
@@ -260,7 +285,7 @@ class KeywordUpdate(BaseModel):
 
     sku_id: Optional[int] = None
     keyword: Optional[str] = Field(default=None, min_length=1, max_length=255)
-    marketplace: Optional[str] = Field(default=None, max_length=10)
+    marketplace: Optional[MarketplaceValue] = Field(default=None, max_length=10)
     notes: Optional[str] = None
 
 
@@ -306,7 +331,7 @@ class ScrapeJobCreate(BaseModel):
     """Schema for creating a competitor scrape job."""
 
     job_name: str = Field(..., min_length=1, max_length=255)
-    marketplace: str = Field(default="com", max_length=10)
+    marketplace: MarketplaceValue = Field(default="com", max_length=10)
     competitor_ids: Optional[List[int]] = None
     sku_id: Optional[int] = None  # Alternative: scrape all competitors for this SKU
 
@@ -338,6 +363,7 @@ class ScrapeJobListResponse(BaseModel):
     page: int
     per_page: int
     pages: int
+    next_cursor: Optional[str] = None
 
 
 class ScrapeItemResponse(BaseModel):
@@ -379,7 +405,7 @@ class DashboardStats(BaseModel):
     total_parent_skus: int = 0
     competitors_by_marketplace: dict = {}
     recent_price_changes: List[PriceChangeResponse] = []
-    upcoming_scrapes: List[Any] = []
+    upcoming_scrapes: List[UpcomingScrapeResponse] = []
 
 
 class ParentSkuStats(BaseModel):
@@ -10,10 +10,11 @@ from datetime import datetime, timedelta
 from decimal import Decimal
 from typing import Optional, List, Tuple, Any
 import logging
-import json
 
-from sqlalchemy import func, and_, or_, desc
-from sqlalchemy.orm import Session, joinedload, subqueryload
+from sqlalchemy import func, and_, or_, case, desc, exists, insert, select, tuple_
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, joinedload, selectinload
 
 
 from .models import (
@@ -35,22 +36,70 @@ from .schemas import (
     ScrapeJobCreate,
     ScheduleType,
 )
+from ..database import json_dumps
 from ..skus.models import Sku
 from ..channel_skus.models import ChannelSku
-from ..pagination import paginate
+from ..pagination import keyset_cursor, paginate, paginate_keyset
 
 logger = logging.getLogger(__name__)
 
+# MySQL error code for "Duplicate entry ... for key"
+MYSQL_DUPLICATE_ENTRY = 1062
+
+# Parsed fields copied as-is into CompetitorData. JSON columns take native
+# dicts/lists; price_saving, unit_price and defaulted fields are set separately.
+_DATA_FIELDS = (
+    "title",
+    "brand",
+    "manufacturer",
+    "retail_price",
+    "shipping_price",
+    "currency",
+    "rating",
+    "review_count",
+    "past_sales",
+    "availability",
+    "sold_by",
+    "fulfilled_by",
+    "seller_id",
+    "features",
+    "product_description",
+    "main_image_url",
+    "images",
+    "videos",
+    "categories",
+    "variations",
+    "product_details",
+    "review_insights",
+    "raw_data",
+)
+
+# Interval until the next scrape for each schedule. ScheduleType is a str
+# enum, so plain stored strings look up the same entries.
+_SCHEDULE_DELTAS = {
+    ScheduleType.DAILY: timedelta(days=1),
+    ScheduleType.EVERY_2_DAYS: timedelta(days=2),
+    ScheduleType.EVERY_3_DAYS: timedelta(days=3),
+    ScheduleType.WEEKLY: timedelta(weeks=1),
+    ScheduleType.MONTHLY: timedelta(days=30),
+}
+
 
 def _serialize_json(val):
     """Serialize dict/list to JSON string for PyMySQL compatibility."""
     if val is None:
         return None
     if isinstance(val, (dict, list)):
-        return json.dumps(val, ensure_ascii=False, default=str)
+        return json_dumps(val)
     return val
 
 
+def _is_duplicate_key(error: IntegrityError) -> bool:
+    """Check whether an IntegrityError is a MySQL duplicate-key violation."""
+    args = getattr(error.orig, "args", ())
+    return bool(args) and args[0] == MYSQL_DUPLICATE_ENTRY
+
+
 class CompetitorService:
     """Service class for competitor operations."""
 
@@ -59,23 +108,42 @@ class CompetitorService:
     # =========================================================================
 
     @staticmethod
-    def create(db: Session, data: CompetitorCreate) -> Competitor:
-        """Create a new competitor."""
-        competitor = Competitor(
-            sku_id=data.sku_id,
-            asin=data.asin.upper(),
-            marketplace=data.marketplace.lower(),
-            pack_size=data.pack_size or 1,
-            display_name=data.display_name,
-            schedule=data.schedule.value,
-            notes=data.notes,
-        )
+    def _competitor_values(data: CompetitorCreate) -> dict:
+        """Build normalized column values for a new competitor."""
+        next_scrape_at = None
         if data.schedule != ScheduleType.NONE:
-            competitor.next_scrape_at = CompetitorService._calculate_next_scrape(
-                data.schedule
-            )
+            next_scrape_at = CompetitorService._calculate_next_scrape(data.schedule)
+        return {
+            "sku_id": data.sku_id,
+            "asin": data.asin,
+            "marketplace": data.marketplace,
+            "pack_size": data.pack_size or 1,
+            "display_name": data.display_name,
+            "schedule": data.schedule,
+            "next_scrape_at": next_scrape_at,
+            "notes": data.notes,
+        }
+
+    @staticmethod
+    def create(db: Session, data: CompetitorCreate) -> Competitor:
+        """
+        Create a new competitor.
+
+        Relies on the unique (asin, marketplace) index instead of a pre-check
+        query; raises ValueError if the pair is already tracked.
+        """
+        competitor = Competitor(**CompetitorService._competitor_values(data))
         db.add(competitor)
-        db.commit()
+        try:
+            db.commit()
+        except IntegrityError as e:
+            db.rollback()
+            if not _is_duplicate_key(e):
+                raise
+            raise ValueError(
+                f"Competitor with ASIN {data.asin} in marketplace "
+                f"{data.marketplace} already exists"
+            )
         db.refresh(competitor)
         return competitor
 
@@ -83,32 +151,69 @@ class CompetitorService:
     def bulk_create(
         db: Session, items: List[CompetitorCreate]
     ) -> Tuple[int, int, List[str]]:
-        """Bulk create competitors. Returns (created, skipped, errors)."""
-        created = 0
+        """
+        Bulk create competitors. Returns (created, skipped, errors).
+
+        Existing (asin, marketplace) pairs are fetched with one IN query and
+        all new rows are written with a single executemany INSERT.
+        """
         skipped = 0
         errors = []
 
+        # One round-trip to find which (asin, marketplace) pairs already exist
+        pairs = {(item.asin, item.marketplace) for item in items}
+        existing = {}
+        if pairs:
+            existing = {
+                (asin, marketplace): sku_id
+                for asin, marketplace, sku_id in db.query(
+                    Competitor.asin, Competitor.marketplace, Competitor.sku_id
+                ).filter(tuple_(Competitor.asin, Competitor.marketplace).in_(pairs))
+            }
+
+        rows = []
         for item in items:
-            try:
-                # Check if already exists for this specific SKU
-                existing = (
-                    db.query(Competitor)
-                    .filter(
-                        Competitor.asin == item.asin.upper(),
-                        Competitor.marketplace == item.marketplace.lower(),
-                        Competitor.sku_id == item.sku_id,
-                    )
-                    .first()
-                )
-                if existing:
+            key = (item.asin, item.marketplace)
+            if key in existing:
+                # Same ASIN already tracked for this SKU - nothing to do
+                if existing[key] == item.sku_id:
                     skipped += 1
-                    continue
+                else:
+                    errors.append(
+                        f"{item.asin}: already tracked in marketplace {key[1]}"
+                    )
+                continue
+
+            # Track within-batch duplicates the same way as stored rows
+            existing[key] = item.sku_id
+            rows.append(CompetitorService._competitor_values(item))
+
+        if not rows:
+            return 0, skipped, errors
+
+        try:
+            db.execute(insert(Competitor), rows)
+            db.commit()
+            return len(rows), skipped, errors
+        except IntegrityError:
+            # A concurrent insert or bad FK; fall back to per-row inserts so
+            # only the offending rows are reported
+            db.rollback()
 
-                CompetitorService.create(db, item)
+        created = 0
+        for row in rows:
+            try:
+                db.execute(insert(Competitor), row)
+                db.commit()
                 created += 1
-            except Exception as e:
-                errors.append(f"{item.asin}: {str(e)}")
+            except IntegrityError as e:
                 db.rollback()
+                if _is_duplicate_key(e):
+                    errors.append(
+                        f"{row['asin']}: already tracked in marketplace {row['marketplace']}"
+                    )
+                else:
+                    errors.append(f"{row['asin']}: invalid reference (e.g. unknown SKU)")
 
         return created, skipped, errors
 
@@ -131,11 +236,18 @@ class CompetitorService:
         marketplace: Optional[str] = None,
         is_active: Optional[bool] = None,
         search: Optional[str] = None,
+        include_data: bool = True,
     ) -> Tuple[List[Competitor], int]:
-        """List competitors with filtering and pagination."""
-        query = db.query(Competitor).options(
-            joinedload(Competitor.sku), joinedload(Competitor.data)
-        )
+        """
+        List competitors with filtering and pagination.
+
+        Scraped data is loaded with one follow-up IN query when include_data
+        is set, rather than widening every row of the paged query with the
+        competitor_data columns (including the large JSON ones).
+        """
+        query = db.query(Competitor).options(joinedload(Competitor.sku))
+        if include_data:
+            query = query.options(selectinload(Competitor.data))
 
         # Apply filters
         if sku_id is not None:
@@ -167,11 +279,10 @@ class CompetitorService:
 
         for field, value in update_data.items():
             if field == "schedule" and value is not None:
-                value = value.value
                 # Recalculate next scrape time
-                if value != "none":
+                if value != ScheduleType.NONE:
                     competitor.next_scrape_at = (
-                        CompetitorService._calculate_next_scrape(ScheduleType(value))
+                        CompetitorService._calculate_next_scrape(value)
                     )
                 else:
                     competitor.next_scrape_at = None
@@ -186,7 +297,7 @@ class CompetitorService:
         db: Session, competitor: Competitor, data: CompetitorScheduleUpdate
     ) -> Competitor:
         """Update competitor schedule."""
-        competitor.schedule = data.schedule.value
+        competitor.schedule = data.schedule
         if data.schedule != ScheduleType.NONE:
             competitor.next_scrape_at = CompetitorService._calculate_next_scrape(
                 data.schedule
@@ -210,10 +321,16 @@ class CompetitorService:
     @staticmethod
     def save_scraped_data(
         db: Session, competitor_id: int, parsed_data: dict
-    ) -> CompetitorData:
-        """Save or update scraped data for a competitor."""
-        # Get competitor for pack_size
-        competitor = db.query(Competitor).filter(Competitor.id == competitor_id).first()
+    ) -> None:
+        """
+        Save or update scraped data for a competitor.
+
+        Written as a single INSERT ... ON DUPLICATE KEY UPDATE against the
+        unique competitor_id key, so there is no existence check round-trip
+        and concurrent saves for the same competitor cannot race.
+        """
+        # Get competitor for pack_size (identity map hit when the caller has it loaded)
+        competitor = db.get(Competitor, competitor_id)
         if not competitor:
             raise ValueError(f"Competitor {competitor_id} not found")
 
@@ -224,85 +341,45 @@ class CompetitorService:
         if price is not None and pack_size > 0:
             unit_price = Decimal(str(price)) / pack_size
 
-        # Check for existing data
-        existing = (
-            db.query(CompetitorData)
-            .filter(CompetitorData.competitor_id == competitor_id)
-            .first()
+        data_fields = {field: parsed_data.get(field) for field in _DATA_FIELDS}
+        data_fields.update(
+            price=price,
+            unit_price=unit_price,
+            price_saving=_serialize_json(parsed_data.get("price_saving")),
+            is_prime=parsed_data.get("is_prime", False),
+            variations_count=parsed_data.get("variations_count", 0),
+            scraped_at=datetime.utcnow(),
         )
 
-        # Debug: log types of all fields
-        for key, val in parsed_data.items():
-            if isinstance(val, (dict, list)):
-                logger.warning(f"Field '{key}' is {type(val).__name__}: {str(val)[:100]}")
-
-        data_fields = {
-            "title": parsed_data.get("title"),
-            "brand": parsed_data.get("brand"),
-            "manufacturer": parsed_data.get("manufacturer"),
-            "price": price,
-            "retail_price": parsed_data.get("retail_price"),
-            "shipping_price": parsed_data.get("shipping_price"),
-            "currency": parsed_data.get("currency"),
-            "unit_price": unit_price,
-            "price_saving": _serialize_json(parsed_data.get("price_saving")),
-            "rating": parsed_data.get("rating"),
-            "review_count": parsed_data.get("review_count"),
-            "past_sales": parsed_data.get("past_sales"),
-            "availability": parsed_data.get("availability"),
-            "sold_by": parsed_data.get("sold_by"),
-            "fulfilled_by": parsed_data.get("fulfilled_by"),
-            "seller_id": parsed_data.get("seller_id"),
-            "is_prime": parsed_data.get("is_prime", False),
-            "features": _serialize_json(parsed_data.get("features")),
-            "product_description": parsed_data.get("product_description"),
-            "main_image_url": parsed_data.get("main_image_url"),
-            "images": _serialize_json(parsed_data.get("images")),
-            "videos": _serialize_json(parsed_data.get("videos")),
-            "categories": _serialize_json(parsed_data.get("categories")),
-            "variations": _serialize_json(parsed_data.get("variations")),
-            "variations_count": parsed_data.get("variations_count", 0),
-            "product_details": _serialize_json(parsed_data.get("product_details")),
-            "review_insights": _serialize_json(parsed_data.get("review_insights")),
-            "raw_data": _serialize_json(parsed_data.get("raw_data")),
-            "scraped_at": datetime.utcnow(),
-        }
-
-        if existing:
-            for field, value in data_fields.items():
-                setattr(existing, field, value)
-            db.commit()
-            db.refresh(existing)
-            return existing
-        else:
-            new_data = CompetitorData(competitor_id=competitor_id, **data_fields)
-            db.add(new_data)
-            db.commit()
-            db.refresh(new_data)
-            return new_data
+        stmt = mysql_insert(CompetitorData).values(
+            competitor_id=competitor_id, **data_fields
+        )
+        stmt = stmt.on_duplicate_key_update(
+            {field: stmt.inserted[field] for field in data_fields}
+        )
+        db.execute(stmt)
+        db.commit()
 
     @staticmethod
     def record_price_history(db: Session, competitor_id: int) -> None:
         """Record current price data to history table."""
-        # Get current data
-        data = (
-            db.query(CompetitorData)
-            .filter(CompetitorData.competitor_id == competitor_id)
-            .first()
+        # Copy the current row server-side; inserts nothing if there is no data
+        columns = (
+            "competitor_id",
+            "price",
+            "unit_price",
+            "shipping_price",
+            "availability",
+            "rating",
+            "review_count",
         )
-        if not data:
-            return
-
-        history = CompetitorPriceHistory(
-            competitor_id=competitor_id,
-            price=data.price,
-            unit_price=data.unit_price,
-            shipping_price=data.shipping_price,
-            availability=data.availability,
-            rating=data.rating,
-            review_count=data.review_count,
+        stmt = insert(CompetitorPriceHistory).from_select(
+            columns,
+            select(*(getattr(CompetitorData, c) for c in columns)).where(
+                CompetitorData.competitor_id == competitor_id
+            ),
         )
-        db.add(history)
+        db.execute(stmt)
         db.commit()
 
     @staticmethod
@@ -313,8 +390,14 @@ class CompetitorService:
         per_page: int = 50,
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
-    ) -> Tuple[List[CompetitorPriceHistory], int]:
-        """Get price history for a competitor."""
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[CompetitorPriceHistory], int, Optional[str]]:
+        """
+        Get price history for a competitor.
+
+        Uses keyset pagination when a cursor is given, otherwise falls back
+        to page/offset. Returns (items, total, next_cursor).
+        """
         query = db.query(CompetitorPriceHistory).filter(
             CompetitorPriceHistory.competitor_id == competitor_id
         )
@@ -324,9 +407,31 @@ class CompetitorService:
         if end_date:
             query = query.filter(CompetitorPriceHistory.scraped_at <= end_date)
 
-        query = query.order_by(desc(CompetitorPriceHistory.scraped_at))
+        order_cols = (CompetitorPriceHistory.scraped_at, CompetitorPriceHistory.id)
+        query = query.order_by(*(desc(c) for c in order_cols))
 
-        return paginate(query, page, per_page)
+        return CompetitorService._paginate_with_cursor(
+            query, order_cols, page, per_page, cursor
+        )
+
+    @staticmethod
+    def _paginate_with_cursor(
+        query, order_cols, page: int, per_page: int, cursor: Optional[str]
+    ) -> Tuple[list, int, Optional[str]]:
+        """
+        Paginate by cursor when given, else by page.
+
+        Offset pages still return a next_cursor so clients can switch to
+        keyset pagination after the first page.
+        """
+        if cursor:
+            return paginate_keyset(query, order_cols, cursor, per_page)
+
+        items, total = paginate(query, page, per_page)
+        next_cursor = None
+        if items and page * per_page < total:
+            next_cursor = keyset_cursor(items[-1], order_cols)
+        return items, total, next_cursor
 
     # =========================================================================
     # Keyword Operations
@@ -338,7 +443,7 @@ class CompetitorService:
         keyword = CompetitorKeyword(
             sku_id=data.sku_id,
             keyword=data.keyword,
-            marketplace=data.marketplace.lower(),
+            marketplace=data.marketplace,
             notes=data.notes,
         )
         db.add(keyword)
@@ -348,10 +453,18 @@ class CompetitorService:
 
     @staticmethod
     def get_keyword_by_id(db: Session, keyword_id: int) -> Optional[CompetitorKeyword]:
-        """Get keyword by ID."""
+        """Get keyword by ID with its channel SKU and competitor links."""
         return (
             db.query(CompetitorKeyword)
-            .options(joinedload(CompetitorKeyword.sku))
+            .options(
+                joinedload(CompetitorKeyword.sku),
+                selectinload(CompetitorKeyword.channel_sku_links).joinedload(
+                    KeywordChannelSkuLink.channel_sku
+                ),
+                selectinload(CompetitorKeyword.competitor_links).joinedload(
+                    KeywordCompetitorLink.competitor
+                ),
+            )
             .filter(CompetitorKeyword.id == keyword_id)
             .first()
         )
@@ -364,13 +477,18 @@ class CompetitorService:
         sku_id: Optional[int] = None,
         marketplace: Optional[str] = None,
         search: Optional[str] = None,
-    ) -> Tuple[List[CompetitorKeyword], int]:
-        """List keywords with filtering."""
-        # Use subqueryload for relationships to avoid N+1 queries when counting links
-        query = db.query(CompetitorKeyword).options(
-            joinedload(CompetitorKeyword.sku),
-            subqueryload(CompetitorKeyword.channel_sku_links),
-            subqueryload(CompetitorKeyword.competitor_links),
+    ) -> Tuple[List[Tuple[CompetitorKeyword, int, int]], int]:
+        """
+        List keywords with filtering.
+
+        Returns (keyword, channel_sku_count, competitor_count) rows; link
+        counts are computed in SQL instead of loading the link collections.
+        """
+        query = (
+            db.query(
+                CompetitorKeyword, *CompetitorService._keyword_link_counts()
+            )
+            .options(joinedload(CompetitorKeyword.sku))
         )
 
         if sku_id is not None:
@@ -384,6 +502,25 @@ class CompetitorService:
 
         return paginate(query, page, per_page)
 
+    @staticmethod
+    def _keyword_link_counts() -> tuple:
+        """Correlated COUNT subqueries for a keyword's channel SKU/competitor links."""
+        channel_sku_count = (
+            select(func.count(KeywordChannelSkuLink.id))
+            .where(KeywordChannelSkuLink.keyword_id == CompetitorKeyword.id)
+            .correlate(CompetitorKeyword)
+            .scalar_subquery()
+            .label("linked_channel_skus_count")
+        )
+        competitor_count = (
+            select(func.count(KeywordCompetitorLink.id))
+            .where(KeywordCompetitorLink.keyword_id == CompetitorKeyword.id)
+            .correlate(CompetitorKeyword)
+            .scalar_subquery()
+            .label("linked_competitors_count")
+        )
+        return channel_sku_count, competitor_count
+
     @staticmethod
     def update_keyword(
         db: Session, keyword: CompetitorKeyword, data: KeywordUpdate
@@ -391,8 +528,6 @@ class CompetitorService:
         """Update a keyword."""
         update_data = data.model_dump(exclude_unset=True)
         for field, value in update_data.items():
-            if field == "marketplace" and value:
-                value = value.lower()
             setattr(keyword, field, value)
         db.commit()
         db.refresh(keyword)
@@ -469,24 +604,27 @@ class CompetitorService:
         """Create a new competitor scrape job."""
         job = CompetitorScrapeJob(
             job_name=data.job_name,
-            marketplace=data.marketplace.lower(),
+            marketplace=data.marketplace,
             total_competitors=len(data.competitor_ids),
         )
         db.add(job)
         db.flush()
 
-        # Create items for each competitor
-        for comp_id in data.competitor_ids:
-            competitor = (
-                db.query(Competitor).filter(Competitor.id == comp_id).first()
-            )
-            if competitor:
-                item = CompetitorScrapeItem(
-                    job_id=job.id,
-                    competitor_id=comp_id,
-                    input_asin=competitor.asin,
+        # Resolve all ASINs in one query, then insert items in one executemany
+        asins = {}
+        if data.competitor_ids:
+            asins = dict(
+                db.query(Competitor.id, Competitor.asin).filter(
+                    Competitor.id.in_(set(data.competitor_ids))
                 )
-                db.add(item)
+            )
+        rows = [
+            {"job_id": job.id, "competitor_id": comp_id, "input_asin": asins[comp_id]}
+            for comp_id in data.competitor_ids
+            if comp_id in asins
+        ]
+        if rows:
+            db.execute(insert(CompetitorScrapeItem), rows)
 
         db.commit()
         db.refresh(job)
@@ -510,16 +648,20 @@ class CompetitorService:
         page: int = 1,
         per_page: int = 50,
         status: Optional[str] = None,
-    ) -> Tuple[List[CompetitorScrapeJob], int]:
-        """List scrape jobs."""
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[CompetitorScrapeJob], int, Optional[str]]:
+        """List scrape jobs. Returns (items, total, next_cursor)."""
         query = db.query(CompetitorScrapeJob)
 
         if status:
             query = query.filter(CompetitorScrapeJob.status == status)
 
-        query = query.order_by(desc(CompetitorScrapeJob.created_at))
+        order_cols = (CompetitorScrapeJob.created_at, CompetitorScrapeJob.id)
+        query = query.order_by(*(desc(c) for c in order_cols))
 
-        return paginate(query, page, per_page)
+        return CompetitorService._paginate_with_cursor(
+            query, order_cols, page, per_page, cursor
+        )
 
     @staticmethod
     def get_next_queued_job(db: Session) -> Optional[CompetitorScrapeJob]:
@@ -533,27 +675,39 @@ class CompetitorService:
 
     @staticmethod
     def get_pending_items_for_job(
-        db: Session, job_id: int
+        db: Session, job_id: int, limit: Optional[int] = None
     ) -> List[CompetitorScrapeItem]:
-        """Get pending items for a job."""
-        return (
+        """
+        Get pending items for a job, oldest first.
+
+        Pass limit to fetch just the next batch; the worker commits while
+        processing, so a streamed cursor can't stay open across batches.
+        """
+        query = (
             db.query(CompetitorScrapeItem)
             .filter(
                 CompetitorScrapeItem.job_id == job_id,
                 CompetitorScrapeItem.status == "pending",
             )
-            .all()
+            .order_by(CompetitorScrapeItem.id)
         )
+        if limit:
+            query = query.limit(limit)
+        return query.all()
 
     @staticmethod
     def cancel_scrape_job(db: Session, job: CompetitorScrapeJob) -> None:
-        """Cancel a scrape job."""
-        job.status = "cancelled"
-        # Cancel all pending items
+        """Cancel a scrape job and fail its pending items in one transaction."""
+        # Cancel all pending items; commit() expires the session anyway, so
+        # skip syncing any loaded items in Python
         db.query(CompetitorScrapeItem).filter(
             CompetitorScrapeItem.job_id == job.id,
             CompetitorScrapeItem.status == "pending",
-        ).update({"status": "failed", "error_message": "Job cancelled"})
+        ).update(
+            {"status": "failed", "error_message": "Job cancelled"},
+            synchronize_session=False,
+        )
+        job.status = "cancelled"
         db.commit()
 
     # =========================================================================
@@ -575,30 +729,32 @@ class CompetitorService:
         )
 
     @staticmethod
-    def update_next_scrape(db: Session, competitor: Competitor) -> None:
-        """Update the next scrape time after successful scrape."""
-        schedule = ScheduleType(competitor.schedule)
-        if schedule != ScheduleType.NONE:
-            competitor.next_scrape_at = CompetitorService._calculate_next_scrape(
-                schedule
-            )
-            db.commit()
+    def bulk_update_next_scrape(db: Session, competitor_ids: List[int]) -> None:
+        """
+        Advance next_scrape_at for many scraped competitors in one UPDATE.
+
+        The new time depends only on each row's schedule, so a CASE on the
+        schedule column covers every competitor. Does not commit; runs in
+        the caller's transaction.
+        """
+        if not competitor_ids:
+            return
+        now = datetime.utcnow()
+        next_scrape_at = case(
+            {schedule.value: now + delta for schedule, delta in _SCHEDULE_DELTAS.items()},
+            value=Competitor.schedule,
+        )
+        db.query(Competitor).filter(
+            Competitor.id.in_(competitor_ids),
+            Competitor.schedule != ScheduleType.NONE,
+        ).update({"next_scrape_at": next_scrape_at}, synchronize_session=False)
 
     @staticmethod
-    def _calculate_next_scrape(schedule: ScheduleType) -> datetime:
+    def _calculate_next_scrape(schedule: str) -> datetime:
         """Calculate the next scrape time based on schedule."""
+        delta = _SCHEDULE_DELTAS.get(schedule)
         now = datetime.utcnow()
-        if schedule == ScheduleType.DAILY:
-            return now + timedelta(days=1)
-        elif schedule == ScheduleType.EVERY_2_DAYS:
-            return now + timedelta(days=2)
-        elif schedule == ScheduleType.EVERY_3_DAYS:
-            return now + timedelta(days=3)
-        elif schedule == ScheduleType.WEEKLY:
-            return now + timedelta(weeks=1)
-        elif schedule == ScheduleType.MONTHLY:
-            return now + timedelta(days=30)
-        return now
+        return now + delta if delta else now
 
     # =========================================================================
     # Dashboard & Stats
@@ -632,66 +788,88 @@ class CompetitorService:
         )
         by_marketplace = {mp: count for mp, count in marketplace_counts}
 
-        # Recent price changes (last 7 days with actual price differences)
-        # Get history entries with their competitor info and compare to previous entry
-        recent_price_changes = []
+        # Recent price changes (last 7 days with actual price differences).
+        # LAG() pairs each history entry with the competitor's previous one,
+        # so the comparison happens in a single query instead of one per entry.
+        since = datetime.utcnow() - timedelta(days=7)
+        recent_competitor_ids = (
+            select(CompetitorPriceHistory.competitor_id)
+            .where(CompetitorPriceHistory.scraped_at >= since)
+            .distinct()
+        )
+        history = (
+            select(
+                CompetitorPriceHistory.competitor_id,
+                CompetitorPriceHistory.price,
+                CompetitorPriceHistory.scraped_at,
+                func.lag(
+                    CompetitorPriceHistory.price,
+                    type_=CompetitorPriceHistory.price.type,
+                )
+                .over(
+                    partition_by=CompetitorPriceHistory.competitor_id,
+                    order_by=(
+                        CompetitorPriceHistory.scraped_at,
+                        CompetitorPriceHistory.id,
+                    ),
+                )
+                .label("prev_price"),
+            )
+            .where(CompetitorPriceHistory.competitor_id.in_(recent_competitor_ids))
+            .subquery()
+        )
 
-        # Get recent history entries with competitor joins
-        history_entries = (
+        changes = (
             db.query(
-                CompetitorPriceHistory,
+                history.c.competitor_id,
+                history.c.price,
+                history.c.prev_price,
+                history.c.scraped_at,
                 Competitor.asin,
-                Competitor.sku_id,
                 Sku.sku_code,
             )
-            .join(Competitor, CompetitorPriceHistory.competitor_id == Competitor.id)
+            .join(Competitor, history.c.competitor_id == Competitor.id)
             .outerjoin(Sku, Competitor.sku_id == Sku.id)
             .filter(
-                CompetitorPriceHistory.scraped_at
-                >= datetime.utcnow() - timedelta(days=7)
+                history.c.scraped_at >= since,
+                history.c.prev_price.isnot(None),
+                history.c.price.isnot(None),
+                history.c.price != history.c.prev_price,
             )
-            .order_by(desc(CompetitorPriceHistory.scraped_at))
-            .limit(50)  # Get more to find actual changes
+            .order_by(desc(history.c.scraped_at))
+            .limit(50)
             .all()
         )
 
-        # For each entry, find the previous entry to compare prices
+        # Keep only the latest change per competitor
+        recent_price_changes = []
         seen_competitors = set()
-        for entry, asin, sku_id, sku_code in history_entries:
-            if entry.competitor_id in seen_competitors:
+        for competitor_id, price, prev_price, scraped_at, asin, sku_code in changes:
+            if competitor_id in seen_competitors:
                 continue
-
-            # Get previous entry for this competitor
-            prev_entry = (
-                db.query(CompetitorPriceHistory)
-                .filter(
-                    CompetitorPriceHistory.competitor_id == entry.competitor_id,
-                    CompetitorPriceHistory.id < entry.id
-                )
-                .order_by(desc(CompetitorPriceHistory.id))
-                .first()
-            )
-
-            # Only include if there's a price change
-            if prev_entry and entry.price and prev_entry.price:
-                if entry.price != prev_entry.price:
-                    recent_price_changes.append({
-                        "competitor_id": entry.competitor_id,
-                        "competitor_asin": asin,
-                        "sku_code": sku_code,
-                        "old_price": prev_entry.price,
-                        "new_price": entry.price,
-                        "currency": "USD",  # TODO: Get from competitor data
-                        "recorded_at": entry.scraped_at,
-                    })
-                    seen_competitors.add(entry.competitor_id)
-
+            seen_competitors.add(competitor_id)
+            recent_price_changes.append({
+                "competitor_id": competitor_id,
+                "competitor_asin": asin,
+                "sku_code": sku_code,
+                "old_price": prev_price,
+                "new_price": price,
+                "currency": "USD",  # TODO: Get from competitor data
+                "recorded_at": scraped_at,
+            })
             if len(recent_price_changes) >= 10:
                 break
 
-        # Upcoming scrapes
+        # Upcoming scrapes; only columns in idx_competitor_upcoming are
+        # selected so the index alone serves the query
         upcoming = (
-            db.query(Competitor)
+            db.query(
+                Competitor.id,
+                Competitor.asin,
+                Competitor.marketplace,
+                Competitor.schedule,
+                Competitor.next_scrape_at,
+            )
             .filter(
                 Competitor.is_active == True,
                 Competitor.schedule != "none",
@@ -713,77 +891,111 @@ class CompetitorService:
         }
 
     @staticmethod
-    def get_parent_sku_stats(db: Session, sku_id: int) -> Optional[dict]:
-        """Get statistics for a specific parent SKU."""
-        sku = db.query(Sku).filter(Sku.id == sku_id).first()
-        if not sku:
-            return None
-
-        # Get competitors
-        competitors = (
-            db.query(Competitor)
-            .options(joinedload(Competitor.data))
-            .filter(Competitor.sku_id == sku_id)
-            .all()
+    def _parent_sku_stats_query(db: Session):
+        """
+        Grouped query of per-SKU competitor aggregates.
+
+        Keyword and channel SKU counts are correlated subqueries so their
+        rows don't fan out the competitor price aggregates. NULLIF skips
+        zero prices/ratings so they don't drag the averages down.
+        """
+        keyword_count = (
+            select(func.count(CompetitorKeyword.id))
+            .where(CompetitorKeyword.sku_id == Sku.id)
+            .correlate(Sku)
+            .scalar_subquery()
+        )
+        channel_sku_count = (
+            select(func.count(ChannelSku.id))
+            .where(ChannelSku.sku_id == Sku.id)
+            .correlate(Sku)
+            .scalar_subquery()
         )
+        price = func.nullif(CompetitorData.price, 0)
+        rating = func.nullif(CompetitorData.rating, 0)
 
-        # Get keywords
-        keywords = (
-            db.query(CompetitorKeyword)
-            .filter(CompetitorKeyword.sku_id == sku_id)
-            .all()
+        return (
+            db.query(
+                Sku.id.label("sku_id"),
+                Sku.sku_code,
+                Sku.display_name,
+                func.count(Competitor.id).label("total_competitors"),
+                keyword_count.label("total_keywords"),
+                channel_sku_count.label("total_channel_skus"),
+                func.avg(price).label("avg_competitor_price"),
+                func.min(price).label("min_competitor_price"),
+                func.max(price).label("max_competitor_price"),
+                func.avg(rating).label("avg_competitor_rating"),
+            )
+            .outerjoin(Competitor, Competitor.sku_id == Sku.id)
+            .outerjoin(CompetitorData, CompetitorData.competitor_id == Competitor.id)
+            .group_by(Sku.id, Sku.sku_code, Sku.display_name)
         )
 
-        # Get channel SKUs
-        channel_skus_count = (
-            db.query(func.count(ChannelSku.id))
-            .filter(ChannelSku.sku_id == sku_id)
-            .scalar()
-            or 0
+    @staticmethod
+    def get_parent_sku_stats(
+        db: Session, sku_id: int, include_rows: bool = False
+    ) -> Optional[dict]:
+        """
+        Get statistics for a specific parent SKU.
+
+        Counts and price/rating aggregates come from one SQL query. The
+        competitor and keyword rows are only loaded when include_rows is set.
+        """
+        row = (
+            CompetitorService._parent_sku_stats_query(db)
+            .filter(Sku.id == sku_id)
+            .first()
         )
+        if not row:
+            return None
 
-        # Calculate price stats from competitor data
-        prices = [c.data.price for c in competitors if c.data and c.data.price]
-        ratings = [c.data.rating for c in competitors if c.data and c.data.rating]
+        stats = dict(row._mapping)
+        stats["competitors"] = []
+        stats["keywords"] = []
 
-        return {
-            "sku_id": sku.id,
-            "sku_code": sku.sku_code,
-            "display_name": sku.display_name,
-            "total_competitors": len(competitors),
-            "total_keywords": len(keywords),
-            "total_channel_skus": channel_skus_count,
-            "avg_competitor_price": sum(prices) / len(prices) if prices else None,
-            "min_competitor_price": min(prices) if prices else None,
-            "max_competitor_price": max(prices) if prices else None,
-            "avg_competitor_rating": sum(ratings) / len(ratings) if ratings else None,
-            "competitors": competitors,
-            "keywords": keywords,
-        }
+        if include_rows:
+            stats["competitors"] = (
+                db.query(Competitor).filter(Competitor.sku_id == sku_id).all()
+            )
+            # Keywords with link counts
+            stats["keywords"] = (
+                db.query(
+                    CompetitorKeyword, *CompetitorService._keyword_link_counts()
+                )
+                .filter(CompetitorKeyword.sku_id == sku_id)
+                .all()
+            )
+
+        return stats
 
     @staticmethod
     def list_parent_skus_with_stats(
         db: Session, page: int = 1, per_page: int = 50
     ) -> Tuple[List[dict], int]:
-        """List parent SKUs that have competitors with stats."""
-        # Get SKUs that have competitors
-        subquery = (
-            db.query(Competitor.sku_id)
-            .filter(Competitor.sku_id.isnot(None))
-            .distinct()
+        """
+        List parent SKUs that have competitors with stats.
+
+        The page of SKU ids is picked with an EXISTS semi-join, then only
+        those SKUs are aggregated in one grouped query.
+        """
+        has_competitors = exists().where(Competitor.sku_id == Sku.id)
+        total = db.query(func.count(Sku.id)).filter(has_competitors).scalar() or 0
+
+        page_skus = (
+            db.query(Sku.id)
+            .filter(has_competitors)
+            .order_by(Sku.id)
+            .offset((page - 1) * per_page)
+            .limit(per_page)
             .subquery()
         )
 
-        query = db.query(Sku).filter(Sku.id.in_(db.query(subquery.c.sku_id)))
-        total = query.count()
-
-        skus = query.offset((page - 1) * per_page).limit(per_page).all()
-
-        # Get stats for each SKU
-        result = []
-        for sku in skus:
-            stats = CompetitorService.get_parent_sku_stats(db, sku.id)
-            if stats:
-                result.append(stats)
+        rows = (
+            CompetitorService._parent_sku_stats_query(db)
+            .join(page_skus, page_skus.c.id == Sku.id)
+            .order_by(Sku.id)
+            .all()
+        )
 
-        return result, total
+        return [dict(row._mapping) for row in rows], total
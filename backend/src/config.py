@@ -30,6 +30,18 @@ class Settings(BaseSettings):
     db_user: str = "root"
     db_password: str = ""
     db_name: str = "amazon_reviews_scraper"
+    db_pool_size: int = 20
+    db_max_overflow: int = 40
+    db_pool_timeout: int = 30
+    # Compiled-SQL cache entries per engine (SQLAlchemy default is 500)
+    db_query_cache_size: int = 1200
+    # Raise on any lazy relationship load in eager-loaded queries (tests/staging)
+    strict_loading: bool = False
+
+    # ===== CORS =====
+    # Browser origins allowed to call the API; the bundled frontend is
+    # served same-origin and needs none. JSON list in the environment.
+    cors_origins: list[str] = ["*"]
 
     # ===== Worker Configuration =====
     worker_interval_seconds: int = 30
@@ -39,6 +51,11 @@ class Settings(BaseSettings):
     max_page_size: int = 50
     default_page_size: int = 20
 
+    # ===== Caching =====
+    dashboard_stats_ttl_seconds: int = 60
+    queue_status_ttl_seconds: int = 5
+    scan_summary_ttl_seconds: int = 2
+
     @property
     def database_url(self) -> str:
         """
@@ -2,26 +2,55 @@
 # Amazon Reviews Scraper - Database Connection
 # =============================================================================
 # Purpose: SQLAlchemy engine and session management
-# Public API: engine, SessionLocal, get_db()
+# Public API: engine, SessionLocal, get_db(), db_scope(), eager_only(),
+#             json_dumps()
 # Dependencies: sqlalchemy, config
 # =============================================================================
 
 import json
+from contextlib import contextmanager
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib codec
+    orjson = None
 
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.orm import DeclarativeBase, sessionmaker, raiseload
 
 from .config import settings
 
 
+# ===== JSON Column Codec =====
+def json_dumps(obj) -> str:
+    """
+    Encode a value as a JSON string for storage.
+
+    Shared by the engine's JSON column serializer and code that writes JSON
+    text directly, so both accept the same inputs: orjson when available,
+    non-str dict keys allowed, non-ASCII left unescaped, and unknown types
+    rendered with str().
+    """
+    if orjson:
+        return orjson.dumps(
+            obj, default=str, option=orjson.OPT_NON_STR_KEYS
+        ).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, default=str)
+
+
 # ===== Engine Configuration =====
 engine = create_engine(
     settings.database_url,
+    pool_size=settings.db_pool_size,          # Persistent connections kept open
+    max_overflow=settings.db_max_overflow,    # Extra connections under burst load
+    pool_timeout=settings.db_pool_timeout,    # Seconds to wait for a free connection
+    pool_use_lifo=True,  # Reuse the most recent connection; idle extras time out
     pool_pre_ping=True,  # Verify connections before use
     pool_recycle=3600,   # Recycle connections after 1 hour
+    query_cache_size=settings.db_query_cache_size,  # Reuse compiled SQL across requests
     echo=False,          # Set True for SQL debugging
-    json_serializer=lambda o: json.dumps(o, ensure_ascii=False, default=str),
-    json_deserializer=json.loads,
+    json_serializer=json_dumps,
+    json_deserializer=orjson.loads if orjson else json.loads,
 )
 
 # ===== Session Factory =====
@@ -32,7 +61,13 @@ SessionLocal = sessionmaker(
 )
 
 # ===== Base Class for Models =====
-Base = declarative_base()
+class Base(DeclarativeBase):
+    """
+    Declarative base for all models.
+
+    Supports both typed Mapped[...] / mapped_column() attributes and the
+    older Column() style still used by some domains.
+    """
 
 
 def get_db():
@@ -55,3 +90,51 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+@contextmanager
+def db_scope():
+    """
+    Context manager that provides a short-lived database session.
+
+    For read-only endpoints: the session (and its pooled connection) is
+    released as soon as the block exits, before the response is serialized,
+    rather than at the end of the request as with Depends(get_db). Keep
+    Depends(get_db) for writes that need one session across the handler.
+
+    Yields:
+        Session: SQLAlchemy database session
+
+    Example:
+        @app.get("/items")
+        def get_items():
+            with db_scope() as db:
+                return [ItemOut.model_validate(i) for i in db.query(Item)]
+    """
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def eager_only(*options):
+    """
+    Return query loader options, adding raiseload("*") in strict mode.
+
+    With settings.strict_loading enabled, any relationship not covered by
+    the given eager-load options raises instead of lazy loading, so N+1
+    regressions fail loudly in tests and staging.
+
+    Args:
+        *options: Eager-load options such as selectinload(Model.rel)
+
+    Returns:
+        Tuple of options to pass to Query.options()
+
+    Example:
+        db.query(ScrapeJob).options(*eager_only(selectinload(ScrapeJob.sku)))
+    """
+    if settings.strict_loading:
+        return (*options, raiseload("*"))
+    return options
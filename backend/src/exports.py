@@ -0,0 +1,224 @@
+# =============================================================================
+# Amazon Reviews Scraper - Export Utilities
+# =============================================================================
+# Purpose: Shared helpers for streaming file downloads (CSV, JSON, gzip,
+#          Parquet)
+# Public API: iter_csv, iter_json_array, gzip_stream, accepts_gzip,
+#             iter_parquet, parquet_available
+# Dependencies: csv, zlib, fastapi, orjson (optional), pyarrow (optional)
+# =============================================================================
+
+import csv
+import io
+import json
+import zlib
+from typing import Iterable, Iterator, Sequence, Tuple
+
+from fastapi import Request
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow is optional; Parquet exports are disabled without it
+    pa = None
+    pq = None
+
+
+# Rows buffered before a CSV chunk is yielded to the response
+CSV_FLUSH_ROWS = 500
+
+# Objects buffered before a JSON array chunk is yielded to the response
+JSON_FLUSH_ROWS = 500
+
+# gzip level 1 keeps CPU cost low while still shrinking CSV output several-fold
+GZIP_LEVEL = 1
+
+# Rows per Parquet row group / yielded chunk
+PARQUET_BATCH_ROWS = 5000
+
+
+def iter_csv(
+    header: Sequence,
+    rows: Iterable[Sequence],
+    flush_rows: int = CSV_FLUSH_ROWS,
+) -> Iterator[bytes]:
+    """
+    Encode rows as CSV, yielding UTF-8 chunks of flush_rows rows each.
+
+    Args:
+        header: Column names for the first row
+        rows: Iterable of row sequences
+        flush_rows: Number of rows per yielded chunk
+
+    Yields:
+        UTF-8 encoded CSV chunks
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(header)
+
+    for count, row in enumerate(rows, 1):
+        writer.writerow(row)
+        if count % flush_rows == 0:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate(0)
+
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+def iter_json_array(
+    rows: Iterable[dict],
+    flush_rows: int = JSON_FLUSH_ROWS,
+) -> Iterator[bytes]:
+    """
+    Encode dicts as one JSON array, yielding chunks of flush_rows objects.
+
+    Args:
+        rows: Iterable of JSON-serializable dicts
+        flush_rows: Number of objects per yielded chunk
+
+    Yields:
+        UTF-8 encoded JSON chunks that together form a single array
+    """
+    dumps = orjson.dumps if orjson else _json_dumps_bytes
+    parts = [b"["]
+
+    for count, row in enumerate(rows, 1):
+        if count > 1:
+            parts.append(b",")
+        parts.append(dumps(row))
+        if count % flush_rows == 0:
+            yield b"".join(parts)
+            parts.clear()
+
+    parts.append(b"]")
+    yield b"".join(parts)
+
+
+def _json_dumps_bytes(obj) -> bytes:
+    """Stdlib fallback for orjson.dumps."""
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def gzip_stream(chunks: Iterable[bytes], level: int = GZIP_LEVEL) -> Iterator[bytes]:
+    """
+    Compress a byte stream on the fly into gzip format.
+
+    Args:
+        chunks: Iterable of uncompressed byte chunks
+        level: zlib compression level (1 = fastest)
+
+    Yields:
+        gzip-compressed byte chunks
+    """
+    # wbits=31 writes a gzip header/trailer instead of a raw zlib stream
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def accepts_gzip(request: Request) -> bool:
+    """Check whether the client advertised gzip in Accept-Encoding."""
+    return "gzip" in request.headers.get("accept-encoding", "").lower()
+
+
+def parquet_available() -> bool:
+    """Check whether pyarrow is installed for Parquet exports."""
+    return pq is not None
+
+
+class _ChunkSink:
+    """
+    Write-only file object that hands written bytes back in chunks.
+
+    ParquetWriter records column chunk offsets from tell(), so the
+    position must keep counting even after buffered bytes are drained.
+    """
+
+    def __init__(self):
+        self._chunks = []
+        self._position = 0
+        self.closed = False
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self._chunks.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def iter_parquet(
+    columns: Sequence[Tuple[str, str]],
+    rows: Iterable[Sequence],
+    batch_rows: int = PARQUET_BATCH_ROWS,
+) -> Iterator[bytes]:
+    """
+    Encode rows as a zstd-compressed Parquet file, yielding it in chunks.
+
+    Each batch of rows is written as one row group, so memory use is
+    bounded by batch_rows rather than the full export.
+
+    Args:
+        columns: (name, arrow type alias) pairs, e.g. ("price", "double")
+        rows: Iterable of row sequences in column order
+        batch_rows: Number of rows per row group
+
+    Yields:
+        Parquet file bytes
+
+    Raises:
+        RuntimeError: If pyarrow is not installed
+    """
+    if pq is None:
+        raise RuntimeError("pyarrow is required for Parquet exports")
+
+    schema = pa.schema([(name, pa.type_for_alias(type_)) for name, type_ in columns])
+    sink = _ChunkSink()
+    writer = pq.ParquetWriter(
+        sink, schema, compression="zstd", compression_level=1
+    )
+
+    def write_batch(batch):
+        table = pa.Table.from_arrays(
+            [pa.array(values, type=field.type) for values, field in zip(zip(*batch), schema)],
+            schema=schema,
+        )
+        writer.write_table(table)
+        return sink.drain()
+
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= batch_rows:
+            yield write_batch(batch)
+            batch = []
+
+    if batch:
+        yield write_batch(batch)
+
+    writer.close()
+    yield sink.drain()
@@ -2,24 +2,28 @@
 # Jobs Domain - Route Dependencies
 # =============================================================================
 # Purpose: FastAPI dependencies for job validation
-# Public API: valid_job, valid_job_for_cancel
+# Public API: valid_job, valid_job_with_details, valid_job_for_cancel,
+#             valid_job_for_retry
 # Dependencies: fastapi, sqlalchemy, models
 # =============================================================================
 
 from fastapi import Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 
-from ..database import get_db
+from ..database import get_db, eager_only
 from .models import ScrapeJob
 
 
-async def valid_job(
+def valid_job(
     job_id: int,
     db: Session = Depends(get_db),
 ) -> ScrapeJob:
     """
     Dependency that validates job exists.
 
+    Sync on purpose: the lookup is a blocking DB call, so FastAPI runs it in
+    the threadpool instead of on the event loop.
+
     Raises 404 if job not found.
     """
     job = db.query(ScrapeJob).filter(ScrapeJob.id == job_id).first()
@@ -28,6 +32,31 @@ async def valid_job(
     return job
 
 
+def valid_job_with_details(
+    job_id: int,
+    db: Session = Depends(get_db),
+) -> ScrapeJob:
+    """
+    Dependency that validates job exists, preloading its SKU and ASINs.
+
+    Used by the detail endpoint so rendering the ASIN breakdown doesn't
+    trigger lazy loads.
+
+    Raises 404 if job not found.
+    """
+    job = (
+        db.query(ScrapeJob)
+        .options(
+            *eager_only(selectinload(ScrapeJob.sku), selectinload(ScrapeJob.asins))
+        )
+        .filter(ScrapeJob.id == job_id)
+        .first()
+    )
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+
 async def valid_job_for_cancel(
     job: ScrapeJob = Depends(valid_job),
 ) -> ScrapeJob:
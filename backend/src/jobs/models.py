@@ -6,14 +6,21 @@
 # Dependencies: sqlalchemy, database
 # =============================================================================
 
+from datetime import datetime
+from typing import TYPE_CHECKING, List, Optional
+
 from sqlalchemy import (
-    Column, BigInteger, String, Text, Integer, Enum, JSON, TIMESTAMP,
-    ForeignKey, func
+    BigInteger, String, Text, Integer, Enum, JSON, TIMESTAMP,
+    ForeignKey, func, Index
 )
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from ..database import Base
 
+if TYPE_CHECKING:
+    from ..reviews.models import Review
+    from ..skus.models import Sku
+
 
 class ScrapeJob(Base):
     """
@@ -43,32 +50,52 @@ class ScrapeJob(Base):
 
     __tablename__ = "scrape_job"
 
-    id = Column(BigInteger, primary_key=True, autoincrement=True)
-    sku_id = Column(BigInteger, ForeignKey("sku.id", ondelete="SET NULL"), nullable=True)
-    job_name = Column(String(255), nullable=False)
-    status = Column(
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    sku_id: Mapped[Optional[int]] = mapped_column(
+        BigInteger, ForeignKey("sku.id", ondelete="SET NULL")
+    )
+    job_name: Mapped[str] = mapped_column(String(255))
+    status: Mapped[Optional[str]] = mapped_column(
         Enum("queued", "running", "completed", "partial", "failed", "cancelled"),
         default="queued",
     )
-    marketplace = Column(String(10), default="com")
-    sort_by = Column(String(20), default="recent")
-    max_pages = Column(Integer, default=10)
-    star_filters = Column(JSON, nullable=True)
-    keyword_filter = Column(String(255), nullable=True)
-    reviewer_type = Column(String(20), default="all_reviews")
-    total_asins = Column(Integer, default=0)
-    completed_asins = Column(Integer, default=0)
-    failed_asins = Column(Integer, default=0)
-    total_reviews = Column(Integer, default=0)
-    apify_delay_seconds = Column(Integer, default=10)
-    error_message = Column(Text, nullable=True)
-    created_at = Column(TIMESTAMP, server_default=func.current_timestamp())
-    started_at = Column(TIMESTAMP, nullable=True)
-    completed_at = Column(TIMESTAMP, nullable=True)
+    marketplace: Mapped[Optional[str]] = mapped_column(String(10), default="com")
+    sort_by: Mapped[Optional[str]] = mapped_column(String(20), default="recent")
+    max_pages: Mapped[Optional[int]] = mapped_column(Integer, default=10)
+    star_filters: Mapped[Optional[list]] = mapped_column(JSON)
+    keyword_filter: Mapped[Optional[str]] = mapped_column(String(255))
+    reviewer_type: Mapped[Optional[str]] = mapped_column(String(20), default="all_reviews")
+    total_asins: Mapped[Optional[int]] = mapped_column(Integer, default=0)
+    completed_asins: Mapped[Optional[int]] = mapped_column(Integer, default=0)
+    failed_asins: Mapped[Optional[int]] = mapped_column(Integer, default=0)
+    total_reviews: Mapped[Optional[int]] = mapped_column(Integer, default=0)
+    apify_delay_seconds: Mapped[Optional[int]] = mapped_column(Integer, default=10)
+    error_message: Mapped[Optional[str]] = mapped_column(Text)
+    created_at: Mapped[Optional[datetime]] = mapped_column(
+        TIMESTAMP, server_default=func.current_timestamp()
+    )
+    started_at: Mapped[Optional[datetime]] = mapped_column(TIMESTAMP)
+    completed_at: Mapped[Optional[datetime]] = mapped_column(TIMESTAMP)
 
     # Relationships
-    sku = relationship("Sku", back_populates="jobs")
-    asins = relationship("JobAsin", back_populates="job", cascade="all, delete-orphan")
+    sku: Mapped[Optional["Sku"]] = relationship(back_populates="jobs")
+    # lazy="raise": callers must opt in with selectinload(ScrapeJob.asins);
+    # deletes rely on the FK's ON DELETE CASCADE instead of loading rows
+    asins: Mapped[List["JobAsin"]] = relationship(
+        back_populates="job",
+        cascade="all, delete-orphan",
+        lazy="raise",
+        passive_deletes=True,
+    )
+
+    # Composite indexes matching list_jobs / get_queued_job filters + ordering;
+    # idx_job_created serves unfiltered newest-first reads (dashboard recent
+    # jobs, list_jobs without filters) as a backward index scan
+    __table_args__ = (
+        Index("idx_job_status_created", "status", "created_at"),
+        Index("idx_job_sku_created", "sku_id", "created_at"),
+        Index("idx_job_created", "created_at"),
+    )
 
 
 class JobAsin(Base):
@@ -92,24 +119,35 @@ class JobAsin(Base):
 
     __tablename__ = "job_asin"
 
-    id = Column(BigInteger, primary_key=True, autoincrement=True)
-    job_id = Column(
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    job_id: Mapped[int] = mapped_column(
         BigInteger,
         ForeignKey("scrape_job.id", ondelete="CASCADE"),
-        nullable=False,
     )
-    asin = Column(String(15), nullable=False)
-    product_title = Column(String(500), nullable=True)
-    status = Column(
+    asin: Mapped[str] = mapped_column(String(15))
+    product_title: Mapped[Optional[str]] = mapped_column(String(500))
+    status: Mapped[Optional[str]] = mapped_column(
         Enum("pending", "running", "completed", "failed"),
         default="pending",
     )
-    reviews_found = Column(Integer, default=0)
-    apify_run_id = Column(String(50), nullable=True)
-    error_message = Column(Text, nullable=True)
-    started_at = Column(TIMESTAMP, nullable=True)
-    completed_at = Column(TIMESTAMP, nullable=True)
+    reviews_found: Mapped[Optional[int]] = mapped_column(Integer, default=0)
+    apify_run_id: Mapped[Optional[str]] = mapped_column(String(50))
+    error_message: Mapped[Optional[str]] = mapped_column(Text)
+    started_at: Mapped[Optional[datetime]] = mapped_column(TIMESTAMP)
+    completed_at: Mapped[Optional[datetime]] = mapped_column(TIMESTAMP)
 
     # Relationships
-    job = relationship("ScrapeJob", back_populates="asins")
-    reviews = relationship("Review", back_populates="job_asin", cascade="all, delete-orphan")
+    job: Mapped["ScrapeJob"] = relationship(back_populates="asins")
+    # Review sets can be large; lazy="raise" turns an accidental access into
+    # an error (query reviews through ReviewService). The FK cascades deletes.
+    reviews: Mapped[List["Review"]] = relationship(
+        back_populates="job_asin",
+        cascade="all, delete-orphan",
+        lazy="raise",
+        passive_deletes=True,
+    )
+
+    # Worker lookups filter by job and status together
+    __table_args__ = (
+        Index("idx_job_asin_job_status", "job_id", "status"),
+    )
@@ -6,16 +6,22 @@
 # Dependencies: fastapi, sqlalchemy, service, schemas
 # =============================================================================
 
+import re
 from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 
-from ..database import get_db
-from ..pagination import PaginationParams, get_pagination_params, create_paginated_response
+from ..database import get_db, db_scope
+from ..pagination import PaginationParams, get_pagination_params, create_paginated_response, json_response
 from ..skus.service import SkuService
 from .service import JobService
 from .models import ScrapeJob
-from .dependencies import valid_job, valid_job_for_cancel, valid_job_for_retry
+from .dependencies import (
+    valid_job,
+    valid_job_with_details,
+    valid_job_for_cancel,
+    valid_job_for_retry,
+)
 from .schemas import (
     JobCreate,
     JobResponse,
@@ -31,55 +37,71 @@ from .schemas import (
 
 router = APIRouter(prefix="/api/jobs", tags=["Jobs"])
 
+# Amazon ASINs are 10 uppercase alphanumerics
+_ASIN_RE = re.compile(r"^[A-Z0-9]{10}$")
+
+# Endpoints are plain `def`: the session is synchronous, so FastAPI runs them
+# in its threadpool rather than blocking the event loop on each query.
+
 
 # ===== List Endpoints =====
 
 @router.get("", response_model=JobListResponse)
-async def list_jobs(
+def list_jobs(
     status: Optional[str] = Query(None, description="Filter by status"),
     sku_id: Optional[int] = Query(None, description="Filter by SKU"),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from a previous page (overrides page)"),
     pagination: PaginationParams = Depends(get_pagination_params),
-    db: Session = Depends(get_db),
 ):
     """
     List all jobs with pagination and filters.
 
-    Returns jobs ordered by creation date (newest first).
+    Returns jobs ordered by creation date (newest first). Pass next_cursor
+    back as cursor for constant-cost deep paging; page numbers remain
+    supported for existing clients.
     """
-    service = JobService(db)
-    jobs, total = service.list_jobs(
-        offset=pagination.offset,
-        limit=pagination.limit,
-        status=status,
-        sku_id=sku_id,
-    )
-
-    # Build response items with SKU code
-    items = []
-    for job in jobs:
-        sku_code = job.sku.sku_code if job.sku else None
-        items.append(
-            JobListItem(
-                id=job.id,
-                job_name=job.job_name,
-                sku_code=sku_code,
-                status=job.status,
-                total_asins=job.total_asins,
-                completed_asins=job.completed_asins,
-                failed_asins=job.failed_asins,
-                total_reviews=job.total_reviews,
-                created_at=job.created_at,
-                completed_at=job.completed_at,
+    # Read-only: hold the session only while querying
+    with db_scope() as db:
+        service = JobService(db)
+        try:
+            jobs, total, next_cursor = service.list_jobs(
+                offset=pagination.offset,
+                limit=pagination.limit,
+                status=status,
+                sku_id=sku_id,
+                cursor=cursor,
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+        # Build response items with SKU code (trusted DB values, no validation)
+        items = []
+        for job in jobs:
+            sku_code = job.sku.sku_code if job.sku else None
+            items.append(
+                JobListItem.model_construct(
+                    id=job.id,
+                    job_name=job.job_name,
+                    sku_code=sku_code,
+                    status=job.status,
+                    total_asins=job.total_asins,
+                    completed_asins=job.completed_asins,
+                    failed_asins=job.failed_asins,
+                    total_reviews=job.total_reviews,
+                    created_at=job.created_at,
+                    completed_at=job.completed_at,
+                )
             )
-        )
 
-    return create_paginated_response(items, total, pagination)
+    response = create_paginated_response(items, total, pagination)
+    response["next_cursor"] = next_cursor
+    return json_response(JobListResponse.model_construct(**response))
 
 
 # ===== CRUD Endpoints =====
 
 @router.post("", response_model=JobResponse, status_code=201)
-async def create_job(
+def create_job(
     data: JobCreate,
     db: Session = Depends(get_db),
 ):
@@ -98,8 +120,12 @@ async def create_job(
         sku = sku_service.get_or_create(data.sku_code)
         sku_id = sku.id
 
-    # Clean ASINs
-    asins = [a.strip().upper() for a in data.asins if a.strip()]
+    # Clean ASINs: normalize once, drop duplicates (keeping order) and
+    # anything that isn't a well-formed ASIN
+    asins = [
+        a for a in dict.fromkeys(a.strip().upper() for a in data.asins)
+        if _ASIN_RE.match(a)
+    ]
     if not asins:
         raise HTTPException(status_code=400, detail="No valid ASINs provided")
 
@@ -121,15 +147,15 @@ async def create_job(
 
 
 @router.get("/{job_id}", response_model=JobDetailResponse)
-async def get_job(
-    job: ScrapeJob = Depends(valid_job),
+def get_job(
+    job: ScrapeJob = Depends(valid_job_with_details),
 ):
     """Get job details with ASIN breakdown."""
     response = _build_job_response(job)
 
     # Add ASIN details
     asins = [
-        JobAsinResponse(
+        JobAsinResponse.model_construct(
             id=a.id,
             asin=a.asin,
             product_title=a.product_title,
@@ -142,11 +168,13 @@ async def get_job(
         for a in job.asins
     ]
 
-    return JobDetailResponse(**response.model_dump(), asins=asins)
+    return json_response(
+        JobDetailResponse.model_construct(**dict(response), asins=asins)
+    )
 
 
 @router.delete("/{job_id}", status_code=204)
-async def delete_job(
+def delete_job(
     job: ScrapeJob = Depends(valid_job),
     db: Session = Depends(get_db),
 ):
@@ -158,7 +186,7 @@ async def delete_job(
 # ===== Job Actions =====
 
 @router.post("/{job_id}/cancel", response_model=JobResponse)
-async def cancel_job(
+def cancel_job(
     job: ScrapeJob = Depends(valid_job_for_cancel),
     db: Session = Depends(get_db),
 ):
@@ -170,7 +198,7 @@ async def cancel_job(
 
 
 @router.post("/{job_id}/retry-failed", response_model=JobResponse)
-async def retry_failed_asins(
+def retry_failed_asins(
     job: ScrapeJob = Depends(valid_job_for_retry),
     db: Session = Depends(get_db),
 ):
@@ -185,7 +213,7 @@ async def retry_failed_asins(
     if retry_count == 0:
         raise HTTPException(status_code=400, detail="No failed ASINs to retry")
 
-    # Set job back to queued
+    # Set job back to queued (same transaction as the ASIN reset)
     job.status = "queued"
     job.completed_at = None
     job.error_message = None
@@ -198,17 +226,14 @@ async def retry_failed_asins(
 # ===== ASIN History =====
 
 @router.post("/check-history", response_model=AsinCheckResponse)
-async def check_asin_history(
-    data: AsinCheckRequest,
-    db: Session = Depends(get_db),
-):
+def check_asin_history(data: AsinCheckRequest):
     """
     Check if ASINs have been scraped before.
 
     Returns history info for each ASIN.
     """
-    service = JobService(db)
-    results = service.check_asin_history(data.asins, data.marketplace)
+    with db_scope() as db:
+        results = JobService(db).check_asin_history(data.asins, data.marketplace)
 
     return AsinCheckResponse(
         results=[AsinCheckResult(**r) for r in results]
@@ -218,10 +243,16 @@ async def check_asin_history(
 # ===== Helper Functions =====
 
 def _build_job_response(job: ScrapeJob) -> JobResponse:
-    """Build JobResponse from ScrapeJob model."""
+    """
+    Build JobResponse from ScrapeJob model.
+
+    Uses model_construct: values come straight from typed DB columns, so
+    re-validating every field would only cost time. Request models keep
+    full validation.
+    """
     sku_code = job.sku.sku_code if job.sku else None
 
-    return JobResponse(
+    return JobResponse.model_construct(
         id=job.id,
         job_name=job.job_name,
         sku_id=job.sku_id,
@@ -107,6 +107,7 @@ class JobListResponse(BaseModel):
     total_pages: int
     has_next: bool
     has_previous: bool
+    next_cursor: Optional[str] = None
 
 
 class JobDetailResponse(JobResponse):
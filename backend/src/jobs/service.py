@@ -8,10 +8,11 @@
 
 import json
 from typing import Optional, List
-from datetime import datetime
-from sqlalchemy.orm import Session
-from sqlalchemy import func, desc
+from sqlalchemy.orm import Session, load_only, selectinload
+from sqlalchemy import case, func, desc, insert, select, update
 
+from ..database import eager_only
+from ..pagination import keyset_cursor, paginate_keyset
 from .models import ScrapeJob, JobAsin
 from ..skus.models import Sku
 from ..reviews.models import AsinHistory
@@ -47,7 +48,7 @@ class JobService:
 
         Args:
             job_name: User-provided job name
-            asins: List of ASIN codes to scrape
+            asins: Normalized (uppercase, deduplicated) ASIN codes to scrape
             sku_id: Optional SKU reference
             marketplace: Amazon domain
             sort_by: Sort order for reviews
@@ -81,14 +82,15 @@ class JobService:
         self.db.add(job)
         self.db.flush()  # Get job.id
 
-        # Create job ASINs
-        for asin in asins:
-            job_asin = JobAsin(
-                job_id=job.id,
-                asin=asin.strip().upper(),
-                status="pending",
+        # Create job ASINs in one executemany insert
+        if asins:
+            self.db.execute(
+                insert(JobAsin),
+                [
+                    {"job_id": job.id, "asin": asin, "status": "pending"}
+                    for asin in asins
+                ],
             )
-            self.db.add(job_asin)
 
         self.db.commit()
         self.db.refresh(job)
@@ -106,32 +108,85 @@ class JobService:
         limit: int = 50,
         status: Optional[str] = None,
         sku_id: Optional[int] = None,
-    ) -> tuple[List[ScrapeJob], int]:
+        cursor: Optional[str] = None,
+    ) -> tuple[List[ScrapeJob], int, Optional[str]]:
         """
         List jobs with filters and pagination.
 
+        With a cursor, the page is fetched by keyset seek on
+        (created_at, id) instead of OFFSET; offset paging is kept for
+        existing clients and also hands back a cursor for the next page.
+
         Returns:
-            Tuple of (job list, total count)
+            Tuple of (job list, total count, next cursor or None)
+
+        Raises:
+            ValueError: If the cursor cannot be decoded
         """
-        query = self.db.query(ScrapeJob)
+        # Only the JobListItem columns are fetched (no JSON/TEXT payloads);
+        # SKU codes are batch-loaded with one IN query instead of per row
+        query = self.db.query(ScrapeJob).options(
+            load_only(
+                ScrapeJob.id,
+                ScrapeJob.job_name,
+                ScrapeJob.sku_id,
+                ScrapeJob.status,
+                ScrapeJob.total_asins,
+                ScrapeJob.completed_asins,
+                ScrapeJob.failed_asins,
+                ScrapeJob.total_reviews,
+                ScrapeJob.created_at,
+                ScrapeJob.completed_at,
+            ),
+            *eager_only(selectinload(ScrapeJob.sku)),
+        )
 
         if status:
             query = query.filter(ScrapeJob.status == status)
         if sku_id:
             query = query.filter(ScrapeJob.sku_id == sku_id)
 
-        query = query.order_by(desc(ScrapeJob.created_at))
+        order_cols = (ScrapeJob.created_at, ScrapeJob.id)
+        query = query.order_by(*(desc(col) for col in order_cols))
 
-        total = query.count()
-        items = query.offset(offset).limit(limit).all()
-        return items, total
+        if cursor:
+            return paginate_keyset(query, order_cols, cursor, limit)
+
+        # COUNT(*) OVER() returns the filtered total on every row, so the
+        # page and its total come back in a single round-trip
+        rows = (
+            query.add_columns(func.count().over().label("total"))
+            .offset(offset)
+            .limit(limit)
+            .all()
+        )
+        if not rows:
+            # Empty page: only past-the-end offsets need a separate count
+            if not offset:
+                return [], 0, None
+            total = query.with_entities(func.count(ScrapeJob.id)).order_by(None).scalar()
+            return [], total, None
+
+        items = [row.ScrapeJob for row in rows]
+        total = rows[0].total
+        next_cursor = None
+        if offset + len(items) < total:
+            next_cursor = keyset_cursor(items[-1], order_cols)
+        return items, total, next_cursor
 
     def get_queued_job(self) -> Optional[ScrapeJob]:
-        """Get oldest queued job for processing."""
+        """
+        Claim the oldest queued job for processing.
+
+        The row is locked with FOR UPDATE SKIP LOCKED so concurrent workers
+        each claim a different job without waiting on one another. The
+        caller must mark it running (start_job) before the next commit.
+        """
         return (
             self.db.query(ScrapeJob)
             .filter(ScrapeJob.status == "queued")
             .order_by(ScrapeJob.created_at)
+            .with_for_update(skip_locked=True)
             .first()
         )
 
@@ -140,49 +195,62 @@ class JobService:
     def start_job(self, job: ScrapeJob) -> None:
         """Mark job as running."""
         job.status = "running"
-        job.started_at = datetime.utcnow()
+        job.started_at = func.current_timestamp()
         self.db.commit()
 
     def complete_job(self, job: ScrapeJob, partial: bool = False) -> None:
         """Mark job as completed or partial."""
         job.status = "partial" if partial else "completed"
-        job.completed_at = datetime.utcnow()
+        job.completed_at = func.current_timestamp()
         self.db.commit()
 
     def fail_job(self, job: ScrapeJob, error_message: str) -> None:
         """Mark job as failed."""
         job.status = "failed"
         job.error_message = error_message
-        job.completed_at = datetime.utcnow()
+        job.completed_at = func.current_timestamp()
         self.db.commit()
 
     def cancel_job(self, job: ScrapeJob) -> None:
         """Cancel a job."""
         job.status = "cancelled"
-        job.completed_at = datetime.utcnow()
+        job.completed_at = func.current_timestamp()
         self.db.commit()
 
     def sync_job_stats(self, job: ScrapeJob) -> None:
         """
         Sync job statistics from job_asin records.
 
-        Uses database aggregation per best practices.
+        Uses database aggregation per best practices, applied in one
+        UPDATE so the job row is written without a separate SELECT.
         """
         stats = (
-            self.db.query(
+            select(
+                JobAsin.job_id,
                 func.count(JobAsin.id).label("total"),
-                func.sum(func.if_(JobAsin.status == "completed", 1, 0)).label("completed"),
-                func.sum(func.if_(JobAsin.status == "failed", 1, 0)).label("failed"),
-                func.sum(JobAsin.reviews_found).label("reviews"),
+                # COUNT(CASE ...) skips NULLs and is never NULL itself; this
+                # is the portable form of COUNT(*) FILTER (WHERE ...)
+                func.count(case((JobAsin.status == "completed", 1))).label("completed"),
+                func.count(case((JobAsin.status == "failed", 1))).label("failed"),
+                func.coalesce(func.sum(JobAsin.reviews_found), 0).label("reviews"),
             )
-            .filter(JobAsin.job_id == job.id)
-            .first()
+            .where(JobAsin.job_id == job.id)
+            .group_by(JobAsin.job_id)
+            .subquery()
         )
 
-        job.total_asins = stats.total or 0
-        job.completed_asins = int(stats.completed or 0)
-        job.failed_asins = int(stats.failed or 0)
-        job.total_reviews = int(stats.reviews or 0)
+        # Single multi-table UPDATE joining the aggregate derived table
+        self.db.execute(
+            update(ScrapeJob)
+            .where(ScrapeJob.id == stats.c.job_id)
+            .values(
+                total_asins=stats.c.total,
+                completed_asins=stats.c.completed,
+                failed_asins=stats.c.failed,
+                total_reviews=stats.c.reviews,
+            )
+            .execution_options(synchronize_session=False)
+        )
         self.db.commit()
 
     def delete_job(self, job: ScrapeJob) -> None:
@@ -193,10 +261,17 @@ class JobService:
     # ===== ASIN Operations =====
 
     def get_pending_asin(self, job_id: int) -> Optional[JobAsin]:
-        """Get next pending ASIN for a job."""
+        """
+        Claim the next pending ASIN for a job.
+
+        Locked with FOR UPDATE SKIP LOCKED like get_queued_job; the caller
+        marks it running before committing.
+        """
         return (
             self.db.query(JobAsin)
             .filter(JobAsin.job_id == job_id, JobAsin.status == "pending")
+            .order_by(JobAsin.id)
+            .with_for_update(skip_locked=True)
             .first()
         )
 
@@ -212,15 +287,18 @@ class JobService:
         """
         Reset failed ASINs to pending for retry.
 
+        Does not commit; the caller commits together with the job status
+        change so the retry is a single transaction.
+
         Returns count of ASINs reset.
         """
-        result = (
-            self.db.query(JobAsin)
-            .filter(JobAsin.job_id == job_id, JobAsin.status == "failed")
-            .update({"status": "pending", "error_message": None})
+        result = self.db.execute(
+            update(JobAsin)
+            .where(JobAsin.job_id == job_id, JobAsin.status == "failed")
+            .values(status="pending", error_message=None)
+            .execution_options(synchronize_session=False)
         )
-        self.db.commit()
-        return result
+        return result.rowcount
 
     # ===== ASIN History =====
 
@@ -234,26 +312,36 @@ class JobService:
 
         Returns list of dicts with history info.
         """
-        results = []
-        for asin in asins:
-            asin_upper = asin.strip().upper()
-            history = (
-                self.db.query(AsinHistory)
-                .filter(
-                    AsinHistory.asin == asin_upper,
+        asins_upper = [asin.strip().upper() for asin in asins]
+
+        # One IN query over the (asin, marketplace) unique key, fetching
+        # only the two columns we report as plain tuples (no ORM objects).
+        # Inputs are normalized here rather than wrapping the column in
+        # UPPER()/TRIM(), which would stop MySQL using the index.
+        found = {}
+        if asins_upper:
+            found = {
+                asin: (last_scraped_at, last_job_id)
+                for asin, last_scraped_at, last_job_id in self.db.query(
+                    AsinHistory.asin,
+                    AsinHistory.last_scraped_at,
+                    AsinHistory.last_scraped_job_id,
+                ).filter(
+                    AsinHistory.asin.in_(set(asins_upper)),
                     AsinHistory.marketplace == marketplace,
                 )
-                .first()
-            )
-
-            results.append({
-                "asin": asin_upper,
-                "previously_scraped": history is not None,
-                "last_scraped_at": history.last_scraped_at if history else None,
-                "last_job_id": history.last_scraped_job_id if history else None,
-            })
-
-        return results
+            }
+
+        missing = (None, None)
+        return [
+            {
+                "asin": asin,
+                "previously_scraped": asin in found,
+                "last_scraped_at": found.get(asin, missing)[0],
+                "last_job_id": found.get(asin, missing)[1],
+            }
+            for asin in asins_upper
+        ]
 
     def update_asin_history(
         self,
@@ -273,14 +361,14 @@ class JobService:
 
         if history:
             history.last_scraped_job_id = job_id
-            history.last_scraped_at = datetime.utcnow()
+            history.last_scraped_at = func.current_timestamp()
             history.total_scrapes += 1
         else:
             history = AsinHistory(
                 asin=asin,
                 marketplace=marketplace,
                 last_scraped_job_id=job_id,
-                last_scraped_at=datetime.utcnow(),
+                last_scraped_at=func.current_timestamp(),
                 total_scrapes=1,
             )
             self.db.add(history)
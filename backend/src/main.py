@@ -6,17 +6,26 @@
 # Dependencies: fastapi, uvicorn, routers
 # =============================================================================
 
+import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse, ORJSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy import func
+from sqlalchemy import case, func, select
 
+from .cache import dashboard_cache
 from .config import settings
-from .database import SessionLocal, engine, Base
+from .database import db_scope, engine, Base
 from .skus.router import router as skus_router
 from .jobs.router import router as jobs_router
 from .reviews.router import router as reviews_router
@@ -37,6 +46,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Runs the independent dashboard queries side by side (one per query)
+_dashboard_executor = ThreadPoolExecutor(max_workers=3, thread_name_prefix="dashboard")
+
 
 # ===== Lifespan Management =====
 @asynccontextmanager
@@ -47,6 +59,7 @@ async def lifespan(app: FastAPI):
     Starts background worker on startup, stops on shutdown.
     """
     logger.info("Starting Amazon Reviews Scraper API")
+    logger.info("Database pool: %s", engine.pool.status())
 
     # Start background worker
     start_worker()
@@ -66,14 +79,18 @@ app = FastAPI(
     description="API for scraping Amazon product reviews using Apify",
     version="1.0.0",
     lifespan=lifespan,
+    # orjson renders large list responses much faster than the stdlib encoder
+    default_response_class=ORJSONResponse if orjson else JSONResponse,
 )
 
 
 # ===== CORS Middleware =====
+# Explicit origins are matched by set lookup; credentials cannot be combined
+# with the "*" wildcard, so they are only allowed for an explicit list
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Adjust in production
-    allow_credentials=True,
+    allow_origins=settings.cors_origins,
+    allow_credentials="*" not in settings.cors_origins,
     allow_methods=["*"],
     allow_headers=["*"],
 )
@@ -90,108 +107,146 @@ app.include_router(competitors_router)
 
 # ===== Dashboard Endpoint =====
 @app.get("/api/dashboard/stats")
-async def get_dashboard_stats():
+def get_dashboard_stats():
     """
     Get dashboard statistics.
 
-    Returns counts and recent activity for the dashboard page.
+    Returns counts and recent activity for the dashboard page. Cached for
+    settings.dashboard_stats_ttl_seconds; the worker clears the cache
+    whenever a job finishes.
+
+    Plain `def` (like the jobs router): the session is synchronous, so
+    FastAPI runs this in its threadpool instead of on the event loop.
     """
-    db = SessionLocal()
-    try:
-        # Job counts by status
-        status_counts = dict(
-            db.query(ScrapeJob.status, func.count(ScrapeJob.id))
-            .group_by(ScrapeJob.status)
-            .all()
-        )
+    # The cache holds the encoded body, so hits skip serialization entirely
+    body = dashboard_cache.get_or_set(
+        "stats",
+        settings.dashboard_stats_ttl_seconds,
+        lambda: _render_json(_compute_dashboard_stats()),
+    )
+    return Response(content=body, media_type="application/json")
 
-        # Total reviews
-        total_reviews = (
-            db.query(func.sum(ScrapeJob.total_reviews))
-            .scalar() or 0
-        )
 
-        # Total SKUs
-        total_skus = db.query(func.count(Sku.id)).scalar() or 0
+def _render_json(content: dict) -> bytes:
+    """Encode a response body once; orjson writes datetimes as ISO 8601."""
+    if orjson:
+        return orjson.dumps(content)
+    return json.dumps(content, default=lambda v: v.isoformat()).encode("utf-8")
 
-        # Recent jobs
-        recent_jobs = (
-            db.query(ScrapeJob)
-            .order_by(ScrapeJob.created_at.desc())
-            .limit(5)
-            .all()
-        )
 
-        recent_jobs_data = [
-            {
-                "id": j.id,
-                "job_name": j.job_name,
-                "status": j.status,
-                "total_reviews": j.total_reviews,
-                "created_at": j.created_at.isoformat(),
-            }
-            for j in recent_jobs
-        ]
+def _compute_dashboard_stats() -> dict:
+    """
+    Query the dashboard statistics from the database.
 
+    The three queries are independent, so each runs on its own pooled
+    session in parallel and the page waits for the slowest one rather
+    than the sum of all three round-trips.
+    """
+    job_future = _dashboard_executor.submit(_query_job_stats)
+    scan_future = _dashboard_executor.submit(_query_scan_stats)
+    recent_future = _dashboard_executor.submit(_query_recent_jobs)
+    stats = job_future.result()
+    scan_stats = scan_future.result()
+    recent_jobs = recent_future.result()
+
+    recent_jobs_data = [
+        {
+            "id": j.id,
+            "job_name": j.job_name,
+            "status": j.status,
+            "total_reviews": j.total_reviews,
+            "created_at": j.created_at,
+        }
+        for j in recent_jobs
+    ]
+
+    return {
+        "total_jobs": stats.total,
+        "queued_jobs": stats.queued,
+        "running_jobs": stats.running,
+        "completed_jobs": stats.completed,
+        "failed_jobs": stats.failed,
+        "total_reviews": int(stats.reviews),
+        "total_skus": stats.skus,
+        "recent_jobs": recent_jobs_data,
         # Channel SKU Metrics stats
-        total_channel_skus = db.query(func.count(ChannelSku.id)).scalar() or 0
-
-        # Product scan stats
-        scan_status_counts = dict(
-            db.query(ProductScanJob.status, func.count(ProductScanJob.id))
-            .group_by(ProductScanJob.status)
+        "total_channel_skus": stats.channel_skus,
+        "total_product_scans": scan_stats.total,
+        "total_listings_scanned": int(scan_stats.listings),
+        "product_scan_queued": scan_stats.queued,
+        "product_scan_running": scan_stats.running,
+    }
+
+
+def _query_job_stats():
+    """Job counts, review total and SKU counts in one round-trip."""
+    with db_scope() as db:
+        # Conditional aggregates over scrape_job plus scalar subqueries
+        return db.query(
+            func.count(ScrapeJob.id).label("total"),
+            func.count(case((ScrapeJob.status == "queued", 1))).label("queued"),
+            func.count(case((ScrapeJob.status == "running", 1))).label("running"),
+            func.count(case((ScrapeJob.status == "completed", 1))).label("completed"),
+            func.count(case((ScrapeJob.status == "failed", 1))).label("failed"),
+            func.coalesce(func.sum(ScrapeJob.total_reviews), 0).label("reviews"),
+            select(func.count(Sku.id)).scalar_subquery().label("skus"),
+            select(func.count(ChannelSku.id)).scalar_subquery().label("channel_skus"),
+        ).one()
+
+
+def _query_scan_stats():
+    """Product scan job counts and listings scanned."""
+    with db_scope() as db:
+        return db.query(
+            func.count(ProductScanJob.id).label("total"),
+            func.count(case((ProductScanJob.status == "queued", 1))).label("queued"),
+            func.count(case((ProductScanJob.status == "running", 1))).label("running"),
+            func.coalesce(func.sum(ProductScanJob.completed_listings), 0).label("listings"),
+        ).one()
+
+
+def _query_recent_jobs():
+    """Five most recent jobs as column tuples."""
+    with db_scope() as db:
+        return (
+            db.query(
+                ScrapeJob.id,
+                ScrapeJob.job_name,
+                ScrapeJob.status,
+                ScrapeJob.total_reviews,
+                ScrapeJob.created_at,
+            )
+            .order_by(ScrapeJob.created_at.desc())
+            .limit(5)
             .all()
         )
-        total_scans = sum(scan_status_counts.values())
-        total_listings_scanned = (
-            db.query(func.sum(ProductScanJob.completed_listings))
-            .scalar() or 0
-        )
-
-        return {
-            "total_jobs": sum(status_counts.values()),
-            "queued_jobs": status_counts.get("queued", 0),
-            "running_jobs": status_counts.get("running", 0),
-            "completed_jobs": status_counts.get("completed", 0),
-            "failed_jobs": status_counts.get("failed", 0),
-            "total_reviews": int(total_reviews),
-            "total_skus": total_skus,
-            "recent_jobs": recent_jobs_data,
-            # Channel SKU Metrics stats
-            "total_channel_skus": total_channel_skus,
-            "total_product_scans": total_scans,
-            "total_listings_scanned": int(total_listings_scanned),
-            "product_scan_queued": scan_status_counts.get("queued", 0),
-            "product_scan_running": scan_status_counts.get("running", 0),
-        }
-    finally:
-        db.close()
 
 
 # ===== Queue Status Endpoint =====
 @app.get("/api/queue/status")
-async def get_queue_status():
-    """Get current queue status."""
-    db = SessionLocal()
-    try:
-        queued = (
-            db.query(func.count(ScrapeJob.id))
-            .filter(ScrapeJob.status == "queued")
-            .scalar() or 0
-        )
-        running = (
-            db.query(func.count(ScrapeJob.id))
-            .filter(ScrapeJob.status == "running")
-            .scalar() or 0
+def get_queue_status():
+    """Get current queue status (cached for settings.queue_status_ttl_seconds)."""
+    return dashboard_cache.get_or_set(
+        "queue", settings.queue_status_ttl_seconds, _compute_queue_status
+    )
+
+
+def _compute_queue_status() -> dict:
+    """Query queued/running job counts from the database."""
+    with db_scope() as db:
+        # One GROUP BY over the two statuses (a range on idx_job_status_created)
+        counts = dict(
+            db.query(ScrapeJob.status, func.count(ScrapeJob.id))
+            .filter(ScrapeJob.status.in_(("queued", "running")))
+            .group_by(ScrapeJob.status)
+            .all()
         )
 
-        return {
-            "queued": queued,
-            "running": running,
-            "worker_interval": settings.worker_interval_seconds,
-        }
-    finally:
-        db.close()
+    return {
+        "queued": counts.get("queued", 0),
+        "running": counts.get("running", 0),
+        "worker_interval": settings.worker_interval_seconds,
+    }
 
 
 # ===== Health Check =====
@@ -2,13 +2,22 @@
 # Amazon Reviews Scraper - Pagination Utilities
 # =============================================================================
 # Purpose: Shared pagination logic for all list endpoints
-# Public API: PaginationParams, PaginatedResponse, paginate_query
+# Public API: PaginationParams, PaginatedResponse, paginate_query,
+#             paginate, fetch_page, paginate_keyset, keyset_cursor,
+#             create_paginated_response, json_response
 # Dependencies: pydantic, fastapi, sqlalchemy
 # =============================================================================
 
-from typing import Generic, TypeVar, List, Optional
+import base64
+import json
+from collections import namedtuple
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Generic, TypeVar, List, Optional, Sequence
 from pydantic import BaseModel
 from fastapi import Query
+from fastapi.responses import Response
+from sqlalchemy import and_, func, or_
 from sqlalchemy.orm import Query as SQLQuery
 
 from .config import settings
@@ -17,11 +26,14 @@ from .config import settings
 T = TypeVar("T")
 
 
-class PaginationParams(BaseModel):
+@dataclass(frozen=True, slots=True)
+class PaginationParams:
     """
     Pagination parameters for list endpoints.
 
-    Enforces max page size per best practices (50 items max).
+    Enforces max page size per best practices (50 items max). A plain
+    dataclass: get_pagination_params already validates the query values,
+    so there is nothing for a pydantic model to check per request.
     """
 
     page: int = 1
@@ -99,9 +111,7 @@ def paginate_query(
         query = db.query(Job).filter(Job.status == "completed")
         items, total = paginate_query(query, pagination)
     """
-    total = query.count()
-    items = query.offset(pagination.offset).limit(pagination.limit).all()
-    return items, total
+    return fetch_page(query, pagination.offset, pagination.limit)
 
 
 def paginate(query: SQLQuery, page: int = 1, per_page: int = 20) -> tuple[list, int]:
@@ -119,10 +129,129 @@ def paginate(query: SQLQuery, page: int = 1, per_page: int = 20) -> tuple[list,
     Example:
         items, total = paginate(db.query(Model), page=1, per_page=20)
     """
+    return fetch_page(query, (page - 1) * per_page, per_page)
+
+
+def fetch_page(query: SQLQuery, offset: int, limit: int) -> tuple[list, int]:
+    """
+    Fetch one page and the total match count in a single round-trip.
+
+    COUNT(*) OVER() is evaluated before LIMIT, so every returned row carries
+    the filtered total and the filters/joins run once instead of twice.
+    Grouped or DISTINCT queries keep the separate count, since the window
+    would count pre-aggregation rows. An empty page past the end also needs
+    the separate count to report the real total.
+
+    Single-entity queries return the entities; multi-column queries return
+    named tuples supporting both unpacking and attribute access, like Row.
+
+    Args:
+        query: SQLAlchemy query to paginate
+        offset: Rows to skip
+        limit: Max rows to return
+
+    Returns:
+        Tuple of (items list, total count)
+    """
+    if query._group_by_clauses or query._distinct:
+        total = query.count()
+        return query.offset(offset).limit(limit).all(), total
+
+    width = len(query.column_descriptions)
+    rows = (
+        query.add_columns(func.count().over().label("_total"))
+        .offset(offset)
+        .limit(limit)
+        .all()
+    )
+    if not rows:
+        return [], (query.count() if offset else 0)
+
+    total = rows[0][-1]
+    if width == 1:
+        return [row[0] for row in rows], total
+    page_row = namedtuple("PageRow", rows[0]._fields[:width], rename=True)
+    return [page_row(*row[:width]) for row in rows], total
+
+
+def keyset_cursor(item, columns: Sequence) -> str:
+    """
+    Build an opaque cursor pointing just past an item.
+
+    Args:
+        item: Last ORM instance of the current page
+        columns: Ordering columns, e.g. (Model.created_at, Model.id)
+
+    Returns:
+        URL-safe base64 cursor string
+    """
+    values = []
+    for column in columns:
+        value = getattr(item, column.key)
+        values.append(value.isoformat() if isinstance(value, datetime) else value)
+    return base64.urlsafe_b64encode(json.dumps(values).encode()).decode()
+
+
+def _decode_cursor(cursor: str, columns: Sequence) -> list:
+    """Decode a keyset cursor back into typed column values."""
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if not isinstance(values, list) or len(values) != len(columns):
+            raise ValueError
+        return [
+            datetime.fromisoformat(value)
+            if column.type.python_type is datetime
+            else value
+            for value, column in zip(values, columns)
+        ]
+    except (ValueError, TypeError):
+        raise ValueError("Invalid pagination cursor")
+
+
+def paginate_keyset(
+    query: SQLQuery,
+    columns: Sequence,
+    cursor: Optional[str] = None,
+    per_page: int = 20,
+) -> tuple[list, int, Optional[str]]:
+    """
+    Apply keyset (seek) pagination to a query ordered by columns descending.
+
+    Instead of OFFSET, rows after the cursor are selected with a range
+    condition on the ordering columns, so every page is an index seek
+    regardless of depth.
+
+    Args:
+        query: SQLAlchemy query, already ordered by columns DESC
+        columns: Ordering columns, last one must be unique (e.g. id)
+        cursor: Cursor from the previous page, or None for the first page
+        per_page: Items per page
+
+    Returns:
+        Tuple of (items list, total count, next cursor or None)
+
+    Raises:
+        ValueError: If the cursor cannot be decoded
+    """
     total = query.count()
-    offset = (page - 1) * per_page
-    items = query.offset(offset).limit(per_page).all()
-    return items, total
+
+    if cursor:
+        values = _decode_cursor(cursor, columns)
+        # Expanded form of (c1, c2, ...) < (v1, v2, ...) so MySQL can use
+        # the index range on the leading column
+        conditions = []
+        for i, column in enumerate(columns):
+            equal = [columns[j] == values[j] for j in range(i)]
+            conditions.append(and_(*equal, column < values[i]))
+        query = query.filter(or_(*conditions))
+
+    items = query.limit(per_page + 1).all()
+    next_cursor = None
+    if len(items) > per_page:
+        items = items[:per_page]
+        next_cursor = keyset_cursor(items[-1], columns)
+
+    return items, total, next_cursor
 
 
 def calculate_pages(total: int, per_page: int) -> int:
@@ -168,3 +297,21 @@ def create_paginated_response(
         "has_next": pagination.page < total_pages,
         "has_previous": pagination.page > 1,
     }
+
+
+def json_response(model: BaseModel) -> Response:
+    """
+    Serialize a response model directly for hot read endpoints.
+
+    Returning a Response skips FastAPI's re-validation against
+    response_model (still declared for the OpenAPI docs). The model's
+    serializer is compiled once with the class, and pydantic-core writes
+    JSON bytes in one pass instead of building an intermediate dict.
+
+    Args:
+        model: Fully built response model (typically via model_construct)
+
+    Returns:
+        JSON Response with the encoded body
+    """
+    return Response(content=model.model_dump_json(), media_type="application/json")
@@ -88,7 +88,8 @@ class ProductScanJob(Base):
     )
 
     __table_args__ = (
-        Index("idx_product_scan_status", "status"),
+        # Status filters ordered by created_at (job list, queue claim)
+        Index("idx_product_scan_status_created", "status", "created_at"),
         Index("idx_product_scan_created", "created_at", postgresql_ops={"created_at": "DESC"}),
     )
 
@@ -133,7 +134,8 @@ class ProductScanItem(Base):
         default=ItemStatus.PENDING,
         nullable=False,
     )
-    scraped_rating = Column(DECIMAL(2, 1), nullable=True)
+    # Same DECIMAL(2,1) column, handed to Python as float
+    scraped_rating = Column(DECIMAL(2, 1, asdecimal=False), nullable=True)
     scraped_review_count = Column(Integer, nullable=True)
     scraped_title = Column(String(500), nullable=True)
     scraped_asin = Column(String(15), nullable=True)
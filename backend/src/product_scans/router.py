@@ -8,15 +8,19 @@
 
 from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
-from fastapi.responses import StreamingResponse
+from fastapi.responses import FileResponse, StreamingResponse
 from sqlalchemy.orm import Session
-import io
-import csv
-
-from ..database import get_db
-from ..pagination import PaginationParams, get_pagination_params, create_paginated_response
+from starlette.background import BackgroundTask
+import os
+import tempfile
+
+from ..cache import scan_summary_cache
+from ..config import settings
+from ..database import get_db, db_scope
+from ..exports import iter_csv
+from ..pagination import PaginationParams, get_pagination_params, create_paginated_response, json_response
 from .service import ProductScanService
-from .models import JobStatus, ItemStatus
+from .models import JobStatus, ItemStatus, ProductScanJob
 from .schemas import (
     ProductScanJobCreate,
     ProductScanJobResponse,
@@ -32,6 +36,19 @@ from ..channel_skus.schemas import BulkScanRequest
 
 router = APIRouter(prefix="/api/product-scans", tags=["Product Scans"])
 
+# Column headers shared by the CSV and Excel exports
+_SCAN_EXPORT_HEADERS = [
+    "Channel SKU",
+    "Input ASIN",
+    "Status",
+    "Rating",
+    "Review Count",
+    "Product Title",
+    "Scraped ASIN",
+    "ASIN Changed",
+    "Error",
+]
+
 
 # ===== Job CRUD Endpoints =====
 
@@ -117,33 +134,11 @@ async def list_product_scan_jobs(
         search=search,
     )
 
-    # Add progress percentage
-    items = []
-    for job in jobs:
-        progress = 0.0
-        if job.total_listings > 0:
-            progress = (
-                (job.completed_listings + job.failed_listings) / job.total_listings
-            ) * 100
-
-        items.append(
-            ProductScanJobDetailResponse(
-                id=job.id,
-                job_name=job.job_name,
-                status=job.status,
-                marketplace=job.marketplace,
-                total_listings=job.total_listings,
-                completed_listings=job.completed_listings,
-                failed_listings=job.failed_listings,
-                error_message=job.error_message,
-                created_at=job.created_at,
-                started_at=job.started_at,
-                completed_at=job.completed_at,
-                progress_percent=round(progress, 1),
-            )
-        )
+    # Rows already include progress_percent
+    items = [ProductScanJobDetailResponse.model_validate(job) for job in jobs]
 
-    return create_paginated_response(items, total, pagination)
+    response = create_paginated_response(items, total, pagination)
+    return json_response(ProductScanJobListResponse.model_construct(**response))
 
 
 @router.get("/stats", response_model=ProductScanDashboardStats)
@@ -176,12 +171,10 @@ async def get_product_scan_job(
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
 
-    # For running jobs, get real-time progress from item statuses
-    if job.status == JobStatus.RUNNING:
-        completed, failed = service.get_real_time_progress(job.id)
-    else:
-        completed = job.completed_listings
-        failed = job.failed_listings
+    # Counters are incremented as each item finishes, so they are live
+    # for running jobs too
+    completed = job.completed_listings
+    failed = job.failed_listings
 
     progress = 0.0
     if job.total_listings > 0:
@@ -232,15 +225,11 @@ async def get_product_scan_results(
         status=status_enum,
     )
 
-    # Transform items
+    # Transform items (trusted DB values, no validation)
     response_items = []
-    for item in items:
-        asin_changed = (
-            item.scraped_asin is not None
-            and item.scraped_asin != item.input_asin
-        )
+    for item, asin_changed in items:
         response_items.append(
-            ProductScanItemWithSkuResponse(
+            ProductScanItemWithSkuResponse.model_construct(
                 id=item.id,
                 job_id=item.job_id,
                 channel_sku_id=item.channel_sku_id,
@@ -258,14 +247,18 @@ async def get_product_scan_results(
             )
         )
 
-    # Get summary
-    summary_data = service.get_job_summary(job_id)
+    # Get summary; polled while a job runs, so briefly cached per progress
+    summary_data = scan_summary_cache.get_or_set(
+        _summary_cache_key(job),
+        settings.scan_summary_ttl_seconds,
+        lambda: service.get_job_summary(job_id),
+    )
     summary = ProductScanSummary(**summary_data)
 
     paginated = create_paginated_response(response_items, total, pagination)
     paginated["summary"] = summary
 
-    return ProductScanJobResultsResponse(**paginated)
+    return json_response(ProductScanJobResultsResponse.model_construct(**paginated))
 
 
 # ===== Export Endpoints =====
@@ -283,58 +276,52 @@ async def export_scan_results_csv(
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
 
-    items, _ = service.get_job_items(job_id=job_id, offset=0, limit=10000)
-
-    # Create CSV
-    output = io.StringIO()
-    writer = csv.writer(output)
-
-    writer.writerow([
-        "Channel SKU",
-        "Input ASIN",
-        "Status",
-        "Rating",
-        "Review Count",
-        "Product Title",
-        "Scraped ASIN",
-        "ASIN Changed",
-        "Error",
-    ])
-
-    for item in items:
-        asin_changed = (
-            item.scraped_asin and item.scraped_asin != item.input_asin
-        )
-        writer.writerow([
-            item.channel_sku.channel_sku_code,
-            item.input_asin,
-            item.status.value,
-            str(item.scraped_rating) if item.scraped_rating else "",
-            str(item.scraped_review_count) if item.scraped_review_count else "",
-            item.scraped_title or "",
-            item.scraped_asin or "",
-            "Yes" if asin_changed else "No",
-            item.error_message or "",
-        ])
-
-    output.seek(0)
     filename = f"product_scan_{job_id}_results.csv"
 
     return StreamingResponse(
-        iter([output.getvalue()]),
+        iter_csv(_SCAN_EXPORT_HEADERS, _iter_scan_csv_rows(job_id)),
         media_type="text/csv",
         headers={"Content-Disposition": f"attachment; filename={filename}"},
     )
 
 
+def _iter_scan_csv_rows(job_id: int):
+    """
+    Yield CSV rows for a scan job's items.
+
+    Uses its own session: the request's session is closed before the
+    streamed body is consumed.
+    """
+    with db_scope() as db:
+        for item, asin_changed in ProductScanService(db).iter_job_items(job_id):
+            yield [
+                item.channel_sku.channel_sku_code,
+                item.input_asin,
+                item.status.value,
+                str(item.scraped_rating) if item.scraped_rating else "",
+                str(item.scraped_review_count) if item.scraped_review_count else "",
+                item.scraped_title or "",
+                item.scraped_asin or "",
+                "Yes" if asin_changed else "No",
+                item.error_message or "",
+            ]
+
+
 @router.get("/{job_id}/export/excel")
-async def export_scan_results_excel(
+def export_scan_results_excel(
     job_id: int,
     db: Session = Depends(get_db),
 ):
-    """Export scan results as Excel."""
+    """
+    Export scan results as Excel.
+
+    Plain `def` so the workbook is built in the threadpool. A write-only
+    workbook streams rows to disk instead of keeping a Cell object per
+    value, and the finished file is served from a temp file.
+    """
     from openpyxl import Workbook
-    from openpyxl.styles import Font, PatternFill
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Font, NamedStyle, PatternFill
 
     service = ProductScanService(db)
     job = service.get_by_id(job_id)
@@ -342,51 +329,11 @@ async def export_scan_results_excel(
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
 
-    items, _ = service.get_job_items(job_id=job_id, offset=0, limit=10000)
-
     # Create workbook
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Scan Results"
-
-    # Header styling
-    header_font = Font(bold=True)
-    header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-    header_font_white = Font(bold=True, color="FFFFFF")
-
-    headers = [
-        "Channel SKU",
-        "Input ASIN",
-        "Status",
-        "Rating",
-        "Review Count",
-        "Product Title",
-        "Scraped ASIN",
-        "ASIN Changed",
-        "Error",
-    ]
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Scan Results")
 
-    for col, header in enumerate(headers, 1):
-        cell = ws.cell(row=1, column=col, value=header)
-        cell.font = header_font_white
-        cell.fill = header_fill
-
-    # Data rows
-    for row, item in enumerate(items, 2):
-        asin_changed = (
-            item.scraped_asin and item.scraped_asin != item.input_asin
-        )
-        ws.cell(row=row, column=1, value=item.channel_sku.channel_sku_code)
-        ws.cell(row=row, column=2, value=item.input_asin)
-        ws.cell(row=row, column=3, value=item.status.value)
-        ws.cell(row=row, column=4, value=float(item.scraped_rating) if item.scraped_rating else None)
-        ws.cell(row=row, column=5, value=item.scraped_review_count)
-        ws.cell(row=row, column=6, value=item.scraped_title)
-        ws.cell(row=row, column=7, value=item.scraped_asin)
-        ws.cell(row=row, column=8, value="Yes" if asin_changed else "No")
-        ws.cell(row=row, column=9, value=item.error_message)
-
-    # Adjust column widths
+    # Adjust column widths (must be set before rows are written)
     ws.column_dimensions["A"].width = 15
     ws.column_dimensions["B"].width = 15
     ws.column_dimensions["C"].width = 12
@@ -397,17 +344,53 @@ async def export_scan_results_excel(
     ws.column_dimensions["H"].width = 12
     ws.column_dimensions["I"].width = 30
 
-    # Save to bytes
-    output = io.BytesIO()
-    wb.save(output)
-    output.seek(0)
+    # Header styling: one named style registered on the workbook and
+    # referenced by name; data cells keep the default style untouched
+    header_style = NamedStyle(
+        name="scan_header",
+        font=Font(bold=True, color="FFFFFF"),
+        fill=PatternFill(start_color="366092", end_color="366092", fill_type="solid"),
+    )
+    wb.add_named_style(header_style)
+
+    header_row = []
+    for header in _SCAN_EXPORT_HEADERS:
+        cell = WriteOnlyCell(ws, value=header)
+        cell.style = header_style.name
+        header_row.append(cell)
+    ws.append(header_row)
+
+    # Data rows
+    for item, asin_changed in service.iter_job_items(job_id):
+        ws.append([
+            item.channel_sku.channel_sku_code,
+            item.input_asin,
+            item.status.value,
+            item.scraped_rating,
+            item.scraped_review_count,
+            item.scraped_title,
+            item.scraped_asin,
+            "Yes" if asin_changed else "No",
+            item.error_message,
+        ])
+
+    # Save to a temp file, removed once the response has been sent
+    output = tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False)
+    output.close()
+    try:
+        wb.save(output.name)
+    except Exception:
+        # No response will own the file, so nothing else would remove it
+        os.remove(output.name)
+        raise
 
     filename = f"product_scan_{job_id}_results.xlsx"
 
-    return StreamingResponse(
-        iter([output.getvalue()]),
+    return FileResponse(
+        output.name,
         media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-        headers={"Content-Disposition": f"attachment; filename={filename}"},
+        filename=filename,
+        background=BackgroundTask(os.remove, output.name),
     )
 
 
@@ -469,3 +452,19 @@ async def delete_product_scan_job(
         raise HTTPException(status_code=404, detail="Job not found")
 
     service.delete_job(job)
+
+
+# ===== Helper Functions =====
+
+def _summary_cache_key(job: ProductScanJob) -> str:
+    """
+    Cache key for a job's result summary.
+
+    The status and finished-item counters change whenever an item
+    completes or fails, so a new key replaces the old one as the job
+    progresses and the TTL only bounds staleness of pending/running.
+    """
+    return (
+        f"{job.id}:{job.status.value}:"
+        f"{job.completed_listings}:{job.failed_listings}"
+    )
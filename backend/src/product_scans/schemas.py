@@ -8,7 +8,6 @@
 
 from typing import Optional, List
 from datetime import datetime
-from decimal import Decimal
 from pydantic import BaseModel, Field
 
 from .models import JobStatus, ItemStatus
@@ -46,7 +45,7 @@ class ProductScanItemResponse(BaseModel):
     channel_sku_id: int
     input_asin: str
     status: ItemStatus
-    scraped_rating: Optional[Decimal]
+    scraped_rating: Optional[float]
     scraped_review_count: Optional[int]
     scraped_title: Optional[str]
     scraped_asin: Optional[str]
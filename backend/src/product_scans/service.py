@@ -6,15 +6,14 @@
 # Dependencies: sqlalchemy, models, channel_skus
 # =============================================================================
 
-from typing import Optional, List, Tuple
-from datetime import datetime
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import func, or_
+from typing import Dict, Iterator, Optional, List, Tuple
+from sqlalchemy.orm import Session, defer, joinedload, load_only
+from sqlalchemy import and_, case, func, insert, or_, update
 
+from ..pagination import fetch_page
 from .models import ProductScanJob, ProductScanItem, JobStatus, ItemStatus
 from ..channel_skus.models import ChannelSku
 from ..channel_skus.service import ChannelSkuService
-from ..skus.service import SkuService
 
 
 class ProductScanService:
@@ -50,7 +49,6 @@ class ProductScanService:
             Created ProductScanJob
         """
         channel_sku_service = ChannelSkuService(self.db)
-        sku_service = SkuService(self.db)
 
         # Create job
         job = ProductScanJob(
@@ -62,43 +60,26 @@ class ProductScanService:
         self.db.add(job)
         self.db.flush()  # Get job ID
 
-        # Cache for parent SKUs to avoid repeated lookups
-        sku_cache = {}
-
-        # Create scan items
-        for listing in listings:
-            # Get or create parent SKU
-            sku_code = listing.get("sku_code")
-            sku_id = None
-            if sku_code:
-                if sku_code not in sku_cache:
-                    sku = sku_service.get_or_create(sku_code)
-                    sku_cache[sku_code] = sku.id
-                sku_id = sku_cache[sku_code]
-
-            # Get or create Channel SKU
-            channel_sku = channel_sku_service.get_by_code_and_marketplace(
-                listing["channel_sku_code"], marketplace
-            )
-            if not channel_sku:
-                channel_sku = channel_sku_service.create(
-                    channel_sku_code=listing["channel_sku_code"],
-                    marketplace=marketplace,
-                    current_asin=listing["asin"],
-                    sku_id=sku_id,
-                )
-            elif sku_id and not channel_sku.sku_id:
-                # Link existing Channel SKU to parent SKU if not already linked
-                channel_sku.sku_id = sku_id
-
-            item = ProductScanItem(
-                job_id=job.id,
-                channel_sku_id=channel_sku.id,
-                input_asin=listing["asin"],
-                status=ItemStatus.PENDING,
-            )
-            self.db.add(item)
+        # Resolve parent SKUs and Channel SKUs with a few set-based
+        # queries rather than lookups per listing
+        sku_ids = channel_sku_service.get_or_create_sku_ids(
+            listing["sku_code"] for listing in listings if listing.get("sku_code")
+        )
+        channel_sku_ids = channel_sku_service.get_or_create_many(
+            listings, marketplace, sku_ids
+        )
 
+        item_rows = [
+            {
+                "job_id": job.id,
+                "channel_sku_id": channel_sku_ids[listing["channel_sku_code"]],
+                "input_asin": listing["asin"],
+                "status": ItemStatus.PENDING,
+            }
+            for listing in listings
+        ]
+
+        self._insert_items(item_rows)
         self.db.commit()
         self.db.refresh(job)
         return job
@@ -141,19 +122,25 @@ class ProductScanService:
         self.db.flush()
 
         # Create scan items
-        for channel_sku in channel_skus:
-            item = ProductScanItem(
-                job_id=job.id,
-                channel_sku_id=channel_sku.id,
-                input_asin=channel_sku.current_asin,
-                status=ItemStatus.PENDING,
-            )
-            self.db.add(item)
+        self._insert_items([
+            {
+                "job_id": job.id,
+                "channel_sku_id": channel_sku.id,
+                "input_asin": channel_sku.current_asin,
+                "status": ItemStatus.PENDING,
+            }
+            for channel_sku in channel_skus
+        ])
 
         self.db.commit()
         self.db.refresh(job)
         return job
 
+    def _insert_items(self, rows: List[dict]) -> None:
+        """Insert scan item rows in one executemany, bypassing the unit of work."""
+        if rows:
+            self.db.execute(insert(ProductScanItem), rows)
+
     # ===== Job Queries =====
 
     def get_by_id(self, job_id: int) -> Optional[ProductScanJob]:
@@ -170,10 +157,13 @@ class ProductScanService:
         limit: int = 50,
         status: Optional[JobStatus] = None,
         search: Optional[str] = None,
-    ) -> Tuple[List[ProductScanJob], int]:
+    ) -> Tuple[list, int]:
         """
         List jobs with pagination and filters.
 
+        Rows carry the job columns plus progress_percent, computed in SQL,
+        instead of hydrating ProductScanJob instances.
+
         Args:
             offset: Number to skip
             limit: Max to return
@@ -181,9 +171,29 @@ class ProductScanService:
             search: Search job name
 
         Returns:
-            Tuple of (jobs list, total count)
+            Tuple of (job rows, total count)
         """
-        query = self.db.query(ProductScanJob)
+        total_listings = ProductScanJob.total_listings
+        done = ProductScanJob.completed_listings + ProductScanJob.failed_listings
+        progress = case(
+            (total_listings > 0, func.round(done * 100.0 / total_listings, 1)),
+            else_=0.0,
+        ).label("progress_percent")
+
+        query = self.db.query(
+            ProductScanJob.id,
+            ProductScanJob.job_name,
+            ProductScanJob.status,
+            ProductScanJob.marketplace,
+            ProductScanJob.total_listings,
+            ProductScanJob.completed_listings,
+            ProductScanJob.failed_listings,
+            ProductScanJob.error_message,
+            ProductScanJob.created_at,
+            ProductScanJob.started_at,
+            ProductScanJob.completed_at,
+            progress,
+        )
 
         if status:
             query = query.filter(ProductScanJob.status == status)
@@ -192,10 +202,7 @@ class ProductScanService:
             query = query.filter(ProductScanJob.job_name.ilike(f"%{search}%"))
 
         query = query.order_by(ProductScanJob.created_at.desc())
-        total = query.count()
-        items = query.offset(offset).limit(limit).all()
-
-        return items, total
+        return fetch_page(query, offset, limit)
 
     def get_next_queued_job(self) -> Optional[ProductScanJob]:
         """Get the next queued job for processing."""
@@ -211,10 +218,15 @@ class ProductScanService:
     def get_pending_items(
         self, job_id: int, limit: int = 50
     ) -> List[ProductScanItem]:
-        """Get pending items for a job."""
+        """
+        Get pending items for a job.
+
+        raw_data is only ever written by the worker, so it is deferred
+        rather than fetched and decoded for every item in the batch.
+        """
         return (
             self.db.query(ProductScanItem)
-            .options(joinedload(ProductScanItem.channel_sku))
+            .options(defer(ProductScanItem.raw_data))
             .filter(
                 ProductScanItem.job_id == job_id,
                 ProductScanItem.status == ItemStatus.PENDING,
@@ -229,11 +241,16 @@ class ProductScanService:
         offset: int = 0,
         limit: int = 50,
         status: Optional[ItemStatus] = None,
-    ) -> Tuple[List[ProductScanItem], int]:
-        """Get items for a job with pagination."""
+    ) -> Tuple[List[Tuple[ProductScanItem, bool]], int]:
+        """
+        Get items for a job with pagination (result columns only).
+
+        Returns:
+            Tuple of ((item, asin_changed) rows, total count)
+        """
         query = (
-            self.db.query(ProductScanItem)
-            .options(joinedload(ProductScanItem.channel_sku))
+            self.db.query(ProductScanItem, self._asin_changed())
+            .options(*self._result_item_options())
             .filter(ProductScanItem.job_id == job_id)
         )
 
@@ -241,42 +258,85 @@ class ProductScanService:
             query = query.filter(ProductScanItem.status == status)
 
         query = query.order_by(ProductScanItem.id)
-        total = query.count()
-        items = query.offset(offset).limit(limit).all()
+        return fetch_page(query, offset, limit)
 
-        return items, total
+    def iter_job_items(
+        self,
+        job_id: int,
+        batch_size: int = 500,
+    ) -> Iterator[Tuple[ProductScanItem, bool]]:
+        """
+        Iterate over all (item, asin_changed) rows of a job for exports.
+
+        Rows are fetched batch_size at a time with yield_per, so memory
+        stays bounded by one batch however large the job is.
+        """
+        return (
+            self.db.query(ProductScanItem, self._asin_changed())
+            .options(*self._result_item_options())
+            .filter(ProductScanItem.job_id == job_id)
+            .order_by(ProductScanItem.id)
+            .yield_per(batch_size)
+        )
+
+    @staticmethod
+    def _asin_changed():
+        """SQL flag for items whose scraped ASIN differs from the input ASIN."""
+        return case(
+            (
+                and_(
+                    ProductScanItem.scraped_asin.isnot(None),
+                    ProductScanItem.scraped_asin != ProductScanItem.input_asin,
+                ),
+                True,
+            ),
+            else_=False,
+        ).label("asin_changed")
+
+    @staticmethod
+    def _result_item_options() -> tuple:
+        """
+        Loader options for result listings and exports.
+
+        The channel SKU code is joined into the same SELECT (no per-row
+        lazy load), and raw_data/apify_run_id, which these paths never
+        read, are left unloaded.
+        """
+        return (
+            load_only(
+                ProductScanItem.id,
+                ProductScanItem.job_id,
+                ProductScanItem.channel_sku_id,
+                ProductScanItem.input_asin,
+                ProductScanItem.status,
+                ProductScanItem.scraped_rating,
+                ProductScanItem.scraped_review_count,
+                ProductScanItem.scraped_title,
+                ProductScanItem.scraped_asin,
+                ProductScanItem.error_message,
+                ProductScanItem.started_at,
+                ProductScanItem.completed_at,
+            ),
+            joinedload(ProductScanItem.channel_sku).load_only(ChannelSku.channel_sku_code),
+        )
 
     # ===== Status Updates =====
 
     def start_job(self, job: ProductScanJob) -> None:
         """Mark job as running."""
         job.status = JobStatus.RUNNING
-        job.started_at = datetime.utcnow()
+        job.started_at = func.current_timestamp()
         self.db.commit()
 
     def complete_job(self, job: ProductScanJob) -> None:
         """Mark job as completed or partial based on results."""
-        # Count statuses
-        completed = (
-            self.db.query(func.count(ProductScanItem.id))
-            .filter(
-                ProductScanItem.job_id == job.id,
-                ProductScanItem.status == ItemStatus.COMPLETED,
-            )
-            .scalar()
-        )
-        failed = (
-            self.db.query(func.count(ProductScanItem.id))
-            .filter(
-                ProductScanItem.job_id == job.id,
-                ProductScanItem.status == ItemStatus.FAILED,
-            )
-            .scalar()
-        )
+        counts = self._item_status_counts(job.id)
+        completed = counts.get(ItemStatus.COMPLETED, 0)
+        failed = counts.get(ItemStatus.FAILED, 0)
 
-        job.completed_listings = completed or 0
-        job.failed_listings = failed or 0
-        job.completed_at = datetime.utcnow()
+        job.completed_listings = completed
+        job.failed_listings = failed
+        job.completed_at = func.current_timestamp()
 
         if failed > 0 and completed > 0:
             job.status = JobStatus.PARTIAL
@@ -291,7 +351,7 @@ class ProductScanService:
         """Mark job as failed with error."""
         job.status = JobStatus.FAILED
         job.error_message = error_message
-        job.completed_at = datetime.utcnow()
+        job.completed_at = func.current_timestamp()
         self.db.commit()
 
     def cancel_job(self, job: ProductScanJob) -> None:
@@ -300,94 +360,111 @@ class ProductScanService:
             raise ValueError(f"Cannot cancel job in {job.status} status")
 
         job.status = JobStatus.CANCELLED
-        job.completed_at = datetime.utcnow()
+        job.completed_at = func.current_timestamp()
         self.db.commit()
 
-    def mark_item_running(self, item: ProductScanItem) -> None:
-        """Mark item as running."""
-        item.status = ItemStatus.RUNNING
-        item.started_at = datetime.utcnow()
+    def mark_items_running(self, item_ids: List[int]) -> None:
+        """Mark a batch of items as running with one UPDATE and one commit."""
+        if not item_ids:
+            return
+        self.db.execute(
+            update(ProductScanItem)
+            .where(ProductScanItem.id.in_(item_ids))
+            .values(status=ItemStatus.RUNNING, started_at=func.current_timestamp())
+            .execution_options(synchronize_session=False)
+        )
         self.db.commit()
 
-    def complete_item(
-        self,
-        item: ProductScanItem,
-        rating: Optional[float],
-        review_count: Optional[int],
-        title: Optional[str],
-        scraped_asin: Optional[str],
-        raw_data: Optional[dict],
-        apify_run_id: Optional[str] = None,
-    ) -> None:
-        """Mark item as completed with scraped data."""
-        item.status = ItemStatus.COMPLETED
-        item.scraped_rating = rating
-        item.scraped_review_count = review_count
-        item.scraped_title = title
-        item.scraped_asin = scraped_asin
-        item.raw_data = raw_data
-        item.apify_run_id = apify_run_id
-        item.completed_at = datetime.utcnow()
-        self.db.commit()
+    def complete_items(self, job_id: int, updates: List[dict]) -> None:
+        """
+        Record a batch of finished items with one commit.
 
-    def fail_item(
-        self,
-        item: ProductScanItem,
-        error_message: str,
-        apify_run_id: Optional[str] = None,
-    ) -> None:
-        """Mark item as failed."""
-        item.status = ItemStatus.FAILED
-        item.error_message = error_message
-        item.apify_run_id = apify_run_id
-        item.completed_at = datetime.utcnow()
+        Each mapping holds the item ``id``, its final ``status``
+        (COMPLETED or FAILED) and the columns to set, e.g. the scraped
+        fields or ``error_message``. All rows go out as one executemany
+        UPDATE, and the job counters are bumped once for the whole batch.
+
+        Args:
+            job_id: Job the items belong to
+            updates: One mapping per item
+        """
+        if not updates:
+            return
+        self.db.execute(
+            update(ProductScanItem).values(completed_at=func.current_timestamp()),
+            updates,
+        )
+        completed = sum(1 for m in updates if m["status"] == ItemStatus.COMPLETED)
+        self._bump_job_counters(job_id, completed=completed, failed=len(updates) - completed)
         self.db.commit()
 
+    def _bump_job_counters(self, job_id: int, completed: int = 0, failed: int = 0) -> None:
+        """
+        Increment a job's completed/failed counters in place.
+
+        Keeps completed_listings/failed_listings current while the job
+        runs, so progress reads are a single-row lookup instead of a count
+        over the job's items. complete_job still recounts at the end.
+        """
+        self.db.execute(
+            update(ProductScanJob)
+            .where(ProductScanJob.id == job_id)
+            .values(
+                completed_listings=ProductScanJob.completed_listings + completed,
+                failed_listings=ProductScanJob.failed_listings + failed,
+            )
+        )
+
     # ===== Retry Operations =====
 
     def retry_failed_items(self, job: ProductScanJob) -> int:
-        """Reset failed items to pending for retry."""
-        result = (
-            self.db.query(ProductScanItem)
-            .filter(
+        """
+        Reset failed items to pending for retry.
+
+        The item reset and the job reset are two UPDATEs in one
+        transaction, so readers never see requeued items on a job that
+        still reports them as failed.
+
+        Returns count of items reset.
+        """
+        result = self.db.execute(
+            update(ProductScanItem)
+            .where(
                 ProductScanItem.job_id == job.id,
                 ProductScanItem.status == ItemStatus.FAILED,
             )
-            .update({
-                ProductScanItem.status: ItemStatus.PENDING,
-                ProductScanItem.error_message: None,
-                ProductScanItem.started_at: None,
-                ProductScanItem.completed_at: None,
-            })
+            .values(
+                status=ItemStatus.PENDING,
+                error_message=None,
+                started_at=None,
+                completed_at=None,
+            )
+            .execution_options(synchronize_session=False)
         )
 
-        # Reset job status
-        if result > 0:
-            job.status = JobStatus.QUEUED
-            job.completed_at = None
+        # Every failed item was requeued, so the failed counter starts over
+        if result.rowcount > 0:
+            self.db.execute(
+                update(ProductScanJob)
+                .where(ProductScanJob.id == job.id)
+                .values(
+                    status=JobStatus.QUEUED,
+                    completed_at=None,
+                    failed_listings=0,
+                )
+            )
 
         self.db.commit()
-        return result
+        return result.rowcount
 
-    def get_real_time_progress(self, job_id: int) -> tuple[int, int]:
-        """Get real-time completed/failed counts from item statuses."""
-        completed = (
-            self.db.query(func.count(ProductScanItem.id))
-            .filter(
-                ProductScanItem.job_id == job_id,
-                ProductScanItem.status == ItemStatus.COMPLETED,
-            )
-            .scalar() or 0
-        )
-        failed = (
-            self.db.query(func.count(ProductScanItem.id))
-            .filter(
-                ProductScanItem.job_id == job_id,
-                ProductScanItem.status == ItemStatus.FAILED,
-            )
-            .scalar() or 0
+    def _item_status_counts(self, job_id: int) -> Dict[ItemStatus, int]:
+        """Count a job's items per status with one GROUP BY query."""
+        return dict(
+            self.db.query(ProductScanItem.status, func.count(ProductScanItem.id))
+            .filter(ProductScanItem.job_id == job_id)
+            .group_by(ProductScanItem.status)
+            .all()
         )
-        return completed, failed
 
     # ===== Delete Operations =====
 
@@ -399,79 +476,60 @@ class ProductScanService:
     # ===== Statistics =====
 
     def get_job_summary(self, job_id: int) -> dict:
-        """Get summary statistics for a job."""
-        # Status counts
-        status_counts = (
-            self.db.query(
-                ProductScanItem.status,
-                func.count(ProductScanItem.id).label("count"),
-            )
-            .filter(ProductScanItem.job_id == job_id)
-            .group_by(ProductScanItem.status)
-            .all()
-        )
+        """
+        Get summary statistics for a job.
 
-        counts = {s.status.value: s.count for s in status_counts}
+        Status counts, rating average, review total and ASIN changes come
+        from one aggregate over the job's items (AVG/SUM skip NULLs).
+        """
+        item = ProductScanItem
 
-        # Average rating
-        avg_rating = (
-            self.db.query(func.avg(ProductScanItem.scraped_rating))
-            .filter(
-                ProductScanItem.job_id == job_id,
-                ProductScanItem.scraped_rating.isnot(None),
-            )
-            .scalar()
-        )
+        def count_where(condition):
+            return func.count(case((condition, 1)))
 
-        # Total reviews
-        total_reviews = (
-            self.db.query(func.sum(ProductScanItem.scraped_review_count))
-            .filter(
-                ProductScanItem.job_id == job_id,
-                ProductScanItem.scraped_review_count.isnot(None),
-            )
-            .scalar()
-        )
-
-        # ASIN changes count
-        asin_changes = (
-            self.db.query(func.count(ProductScanItem.id))
-            .filter(
-                ProductScanItem.job_id == job_id,
-                ProductScanItem.scraped_asin.isnot(None),
-                ProductScanItem.scraped_asin != ProductScanItem.input_asin,
+        stats = (
+            self.db.query(
+                func.count(item.id).label("total"),
+                count_where(item.status == ItemStatus.COMPLETED).label("completed"),
+                count_where(item.status == ItemStatus.FAILED).label("failed"),
+                count_where(item.status == ItemStatus.PENDING).label("pending"),
+                count_where(item.status == ItemStatus.RUNNING).label("running"),
+                func.avg(item.scraped_rating).label("average_rating"),
+                func.coalesce(func.sum(item.scraped_review_count), 0).label("reviews"),
+                count_where(
+                    and_(
+                        item.scraped_asin.isnot(None),
+                        item.scraped_asin != item.input_asin,
+                    )
+                ).label("asin_changes"),
             )
-            .scalar()
+            .filter(item.job_id == job_id)
+            .one()
         )
 
         return {
-            "total_items": sum(counts.values()),
-            "completed": counts.get("completed", 0),
-            "failed": counts.get("failed", 0),
-            "pending": counts.get("pending", 0),
-            "running": counts.get("running", 0),
-            "average_rating": float(avg_rating) if avg_rating else None,
-            "total_reviews": total_reviews or 0,
-            "asin_changes": asin_changes or 0,
+            "total_items": stats.total,
+            "completed": stats.completed,
+            "failed": stats.failed,
+            "pending": stats.pending,
+            "running": stats.running,
+            "average_rating": float(stats.average_rating) if stats.average_rating else None,
+            "total_reviews": int(stats.reviews),
+            "asin_changes": stats.asin_changes,
         }
 
     def get_dashboard_stats(self) -> dict:
         """Get stats for dashboard."""
-        # Jobs by status
-        status_counts = (
-            self.db.query(
-                ProductScanJob.status,
-                func.count(ProductScanJob.id).label("count"),
-            )
-            .group_by(ProductScanJob.status)
-            .all()
-        )
-
-        # Total listings scanned
-        total_scanned = (
-            self.db.query(func.sum(ProductScanJob.completed_listings))
-            .scalar()
-        )
+        # Total, per-status counts and listings scanned in one aggregate;
+        # COUNT(*) gives the total directly rather than summing the groups
+        stats = self.db.query(
+            func.count(ProductScanJob.id).label("total_jobs"),
+            func.coalesce(func.sum(ProductScanJob.completed_listings), 0).label("listings"),
+            *(
+                func.count(case((ProductScanJob.status == status, 1))).label(status.value)
+                for status in JobStatus
+            ),
+        ).one()
 
         # Recent jobs
         recent = (
@@ -482,8 +540,13 @@ class ProductScanService:
         )
 
         return {
-            "total_jobs": sum(s.count for s in status_counts),
-            "total_listings_scanned": total_scanned or 0,
-            "jobs_by_status": {s.status.value: s.count for s in status_counts},
+            "total_jobs": stats.total_jobs,
+            "total_listings_scanned": int(stats.listings),
+            # Only statuses that occur, as with the previous GROUP BY
+            "jobs_by_status": {
+                status.value: stats._mapping[status.value]
+                for status in JobStatus
+                if stats._mapping[status.value]
+            },
             "recent_jobs": recent,
         }
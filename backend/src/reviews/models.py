@@ -89,7 +89,7 @@ class AsinHistory(Base):
     last_scraped_at = Column(TIMESTAMP, nullable=True)
     total_scrapes = Column(Integer, default=1)
 
-    # Composite unique constraint handled in SQL schema
     __table_args__ = (
+        Index("unique_asin_marketplace", "asin", "marketplace", unique=True),
         Index("idx_asin_history_asin", "asin"),
     )
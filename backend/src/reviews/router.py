@@ -7,13 +7,16 @@
 # =============================================================================
 
 from typing import Optional
-from io import BytesIO
 from fastapi import APIRouter, Depends, Query
-from fastapi.responses import StreamingResponse
+from fastapi.responses import FileResponse, StreamingResponse
 from sqlalchemy.orm import Session
+from starlette.background import BackgroundTask
+import os
+import tempfile
 
-from ..database import get_db
-from ..pagination import PaginationParams, get_pagination_params, create_paginated_response
+from ..database import get_db, db_scope
+from ..exports import iter_json_array
+from ..pagination import PaginationParams, get_pagination_params, create_paginated_response, json_response
 from ..jobs.models import ScrapeJob, JobAsin
 from ..jobs.dependencies import valid_job
 from .service import ReviewService
@@ -54,11 +57,11 @@ async def list_reviews(
         asin=asin,
     )
 
-    # Build response with ASIN info
+    # Build response with ASIN info (trusted DB values, no validation)
     items = []
     for review in reviews:
         items.append(
-            ReviewResponse(
+            ReviewResponse.model_construct(
                 id=review.id,
                 job_asin_id=review.job_asin_id,
                 asin=review.job_asin.asin,
@@ -74,7 +77,8 @@ async def list_reviews(
             )
         )
 
-    return create_paginated_response(items, total, pagination)
+    response = create_paginated_response(items, total, pagination)
+    return json_response(ReviewListResponse.model_construct(**response))
 
 
 # ===== Formatted Output =====
@@ -117,47 +121,62 @@ async def get_review_stats(
 # ===== Export =====
 
 @router.get("/export/json")
-async def export_reviews_json(
+def export_reviews_json(
     job: ScrapeJob = Depends(valid_job),
-    db: Session = Depends(get_db),
 ):
-    """Export all reviews as JSON."""
-    service = ReviewService(db)
-    reviews = service.get_all_reviews_for_job(job.id)
+    """
+    Export all reviews as JSON.
+
+    The array is streamed in chunks as rows are read, rather than built
+    as a list and encoded in one piece.
+    """
+    return StreamingResponse(
+        iter_json_array(_iter_review_export_rows(job.id)),
+        media_type="application/json",
+    )
 
-    # Build export data
-    export_data = []
-    for review in reviews:
-        export_data.append({
-            "asin": review.job_asin.asin,
-            "review_id": review.review_id,
-            "title": review.title,
-            "text": review.text,
-            "rating": review.rating,
-            "date": review.date,
-            "user_name": review.user_name,
-            "verified": review.verified,
-            "helpful_count": review.helpful_count,
-        })
 
-    return export_data
+def _iter_review_export_rows(job_id: int):
+    """
+    Yield export dicts for a job's reviews.
+
+    Uses its own session: the request's session is closed before the
+    streamed body is consumed.
+    """
+    with db_scope() as db:
+        for review in ReviewService(db).iter_reviews_for_job(job_id):
+            yield {
+                "asin": review.asin,
+                "review_id": review.review_id,
+                "title": review.title,
+                "text": review.text,
+                "rating": review.rating,
+                "date": review.date,
+                "user_name": review.user_name,
+                "verified": review.verified,
+                "helpful_count": review.helpful_count,
+            }
 
 
 @router.get("/export/excel")
-async def export_reviews_excel(
+def export_reviews_excel(
     job: ScrapeJob = Depends(valid_job),
     db: Session = Depends(get_db),
 ):
-    """Export all reviews as Excel file."""
+    """
+    Export all reviews as Excel file.
+
+    Plain `def` so the workbook is built in the threadpool. Rows are
+    streamed from the database into a write-only workbook and the file is
+    served from disk, so memory does not grow with the job size.
+    """
     from openpyxl import Workbook
 
     service = ReviewService(db)
-    reviews = service.get_all_reviews_for_job(job.id)
 
     # Create workbook
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Reviews"
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Reviews")
 
     # Header row
     headers = [
@@ -167,9 +186,9 @@ async def export_reviews_excel(
     ws.append(headers)
 
     # Data rows
-    for review in reviews:
+    for review in service.iter_reviews_for_job(job.id):
         ws.append([
-            review.job_asin.asin,
+            review.asin,
             review.review_id,
             review.title,
             review.text,
@@ -180,17 +199,23 @@ async def export_reviews_excel(
             review.helpful_count,
         ])
 
-    # Save to buffer
-    buffer = BytesIO()
-    wb.save(buffer)
-    buffer.seek(0)
+    # Save to a temp file, removed once the response has been sent
+    output = tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False)
+    output.close()
+    try:
+        wb.save(output.name)
+    except Exception:
+        # No response will own the file, so nothing else would remove it
+        os.remove(output.name)
+        raise
 
     # Clean filename
     safe_name = "".join(c if c.isalnum() or c in "-_" else "_" for c in job.job_name)
     filename = f"{safe_name}_reviews.xlsx"
 
-    return StreamingResponse(
-        buffer,
+    return FileResponse(
+        output.name,
         media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-        headers={"Content-Disposition": f"attachment; filename={filename}"},
+        filename=filename,
+        background=BackgroundTask(os.remove, output.name),
     )
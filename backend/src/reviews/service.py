@@ -6,7 +6,7 @@
 # Dependencies: sqlalchemy, models, schemas
 # =============================================================================
 
-from typing import Optional, List
+from typing import Iterator, Optional, List
 from sqlalchemy.orm import Session
 from sqlalchemy import func
 
@@ -160,6 +160,33 @@ class ReviewService:
 
         return query.order_by(Review.id).all()
 
+    def iter_reviews_for_job(self, job_id: int, batch_size: int = 1000) -> Iterator:
+        """
+        Iterate over a job's reviews for exports.
+
+        Yields column rows (the export fields plus the ASIN) rather than
+        Review objects, fetched batch_size at a time with yield_per, so
+        memory stays bounded by one batch and no JobAsin is loaded per
+        review.
+        """
+        return (
+            self.db.query(
+                JobAsin.asin,
+                Review.review_id,
+                Review.title,
+                Review.text,
+                Review.rating,
+                Review.date,
+                Review.user_name,
+                Review.verified,
+                Review.helpful_count,
+            )
+            .join(JobAsin, Review.job_asin_id == JobAsin.id)
+            .filter(JobAsin.job_id == job_id)
+            .order_by(Review.id)
+            .yield_per(batch_size)
+        )
+
     # ===== Formatted Output =====
 
     def get_formatted_reviews(
@@ -230,10 +230,11 @@ async def list_sku_reviews(
         rating=rating,
     )
 
+    # Trusted DB values, no validation
     items = []
     for review in reviews:
         items.append(
-            ReviewResponse(
+            ReviewResponse.model_construct(
                 id=review.id,
                 job_asin_id=review.job_asin_id,
                 asin=review.job_asin.asin,
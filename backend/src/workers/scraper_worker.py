@@ -12,6 +12,9 @@ import threading
 from datetime import datetime
 from typing import Optional
 
+from sqlalchemy import func, select
+
+from ..cache import dashboard_cache
 from ..config import settings
 from ..database import SessionLocal
 from ..jobs.models import ScrapeJob, JobAsin
@@ -112,6 +115,7 @@ def _worker_tick() -> None:
         if review_job:
             logger.info(f"Processing review job {review_job.id}: {review_job.job_name}")
             _process_job(db, review_job)
+            dashboard_cache.clear()
             return
 
         # Process product scan jobs
@@ -120,6 +124,7 @@ def _worker_tick() -> None:
         if product_job:
             logger.info(f"Processing product scan job {product_job.id}: {product_job.job_name}")
             _process_product_scan_job(db, product_job)
+            dashboard_cache.clear()
             return
 
         # Process competitor scrape jobs
@@ -210,7 +215,7 @@ def _process_asin(
 
     # Mark ASIN as running
     asin_record.status = "running"
-    asin_record.started_at = datetime.utcnow()
+    asin_record.started_at = func.current_timestamp()
     db.commit()
 
     try:
@@ -266,7 +271,7 @@ def _process_asin(
         # Update ASIN record
         asin_record.status = "completed"
         asin_record.reviews_found = saved_count
-        asin_record.completed_at = datetime.utcnow()
+        asin_record.completed_at = func.current_timestamp()
         db.commit()
 
         # Update ASIN history
@@ -278,7 +283,7 @@ def _process_asin(
         logger.error(f"ASIN {asin} failed: {e}", exc_info=True)
         asin_record.status = "failed"
         asin_record.error_message = str(e)
-        asin_record.completed_at = datetime.utcnow()
+        asin_record.completed_at = func.current_timestamp()
         db.commit()
 
 
@@ -304,7 +309,9 @@ def _recover_stuck_jobs(db) -> None:
     """
     from datetime import timedelta
 
-    threshold = datetime.utcnow() - timedelta(minutes=30)
+    # Transition timestamps are written by the database, so compare
+    # against its clock rather than this process's
+    threshold = db.scalar(select(func.current_timestamp())) - timedelta(minutes=30)
 
     # Recover stuck review scrape jobs
     stuck_jobs = (
@@ -320,7 +327,7 @@ def _recover_stuck_jobs(db) -> None:
         logger.warning(f"Recovering stuck review job {job.id}")
         job.status = "failed"
         job.error_message = "Job timed out (stuck for > 30 minutes)"
-        job.completed_at = datetime.utcnow()
+        job.completed_at = func.current_timestamp()
 
     # Recover stuck product scan jobs
     stuck_scan_jobs = (
@@ -336,7 +343,7 @@ def _recover_stuck_jobs(db) -> None:
         logger.warning(f"Recovering stuck product scan job {job.id}")
         job.status = JobStatus.FAILED
         job.error_message = "Job timed out (stuck for > 30 minutes)"
-        job.completed_at = datetime.utcnow()
+        job.completed_at = func.current_timestamp()
 
     # Recover stuck competitor scrape jobs
     stuck_competitor_jobs = (
@@ -352,7 +359,7 @@ def _recover_stuck_jobs(db) -> None:
         logger.warning(f"Recovering stuck competitor job {job.id}")
         job.status = "failed"
         job.error_message = "Job timed out (stuck for > 30 minutes)"
-        job.completed_at = datetime.utcnow()
+        job.completed_at = func.current_timestamp()
 
     if stuck_jobs or stuck_scan_jobs or stuck_competitor_jobs:
         db.commit()
@@ -423,15 +430,18 @@ def _process_product_scan_batch(
     """
     Process a batch of product scan items.
 
-    Calls Apify once for all ASINs in the batch for efficiency.
+    Calls Apify once for all ASINs in the batch for efficiency. Results
+    are buffered and written with one commit per batch (items, job
+    counters and Channel SKU metrics) rather than a commit per item.
     """
-    # Build ASIN list and item map
-    asins = [item.input_asin for item in items]
-    item_map = {item.input_asin: item for item in items}
+    # Plain values only: every commit expires the loaded items
+    item_map = {
+        item.input_asin: (item.id, item.channel_sku_id) for item in items
+    }
+    asins = list(item_map)
 
     # Mark all items as running
-    for item in items:
-        scan_service.mark_item_running(item)
+    scan_service.mark_items_running([item_id for item_id, _ in item_map.values()])
 
     logger.info(f"Processing batch of {len(asins)} ASINs for job {job.id}")
 
@@ -459,8 +469,10 @@ def _process_product_scan_batch(
             if result_asin:
                 results_map[result_asin] = result
 
-        # Update each item
-        for asin, item in item_map.items():
+        # Build item updates and Channel SKU metrics
+        item_updates = []
+        metrics = []
+        for asin, (item_id, channel_sku_id) in item_map.items():
             result = results_map.get(asin)
 
             if result:
@@ -470,53 +482,64 @@ def _process_product_scan_batch(
                     # Parse rating
                     rating = ApifyService.parse_rating(result.get("productRating"))
 
-                    # Update item
-                    scan_service.complete_item(
-                        item=item,
-                        rating=rating,
-                        review_count=result.get("countReview"),
-                        title=result.get("title"),
-                        scraped_asin=result.get("asin"),
-                        raw_data=result,
-                    )
-
-                    # Update Channel SKU metrics
-                    channel_sku = item.channel_sku
-                    if channel_sku:
-                        channel_sku_service.update_metrics(
-                            channel_sku=channel_sku,
-                            rating=rating,
-                            review_count=result.get("countReview"),
-                            title=result.get("title"),
-                            scraped_asin=result.get("asin"),
-                            job_id=job.id,
-                        )
+                    item_updates.append({
+                        "id": item_id,
+                        "status": ItemStatus.COMPLETED,
+                        "scraped_rating": rating,
+                        "scraped_review_count": result.get("countReview"),
+                        "scraped_title": result.get("title"),
+                        "scraped_asin": result.get("asin"),
+                        "raw_data": result,
+                    })
+
+                    if channel_sku_id:
+                        metrics.append({
+                            "id": channel_sku_id,
+                            "rating": rating,
+                            "review_count": result.get("countReview"),
+                            "title": result.get("title"),
+                            "scraped_asin": result.get("asin"),
+                        })
 
                     logger.debug(f"ASIN {asin}: rating={rating}, reviews={result.get('countReview')}")
 
                 else:
                     # Non-200 status
                     error_msg = result.get("statusMessage", f"Status code: {status_code}")
-                    scan_service.fail_item(item, error_msg)
+                    item_updates.append(_failed_item(item_id, error_msg))
                     logger.warning(f"ASIN {asin} failed: {error_msg}")
 
             else:
                 # No result found for this ASIN
-                scan_service.fail_item(item, "No result returned from Apify")
+                item_updates.append(_failed_item(item_id, "No result returned from Apify"))
                 logger.warning(f"ASIN {asin}: No result in Apify response")
 
+        # Metrics are staged first so they commit together with the items
+        channel_sku_service.update_metrics_many(metrics, job_id=job.id)
+        scan_service.complete_items(job.id, item_updates)
+
     except ApifyError as e:
         # Apify call failed - mark all items as failed
         logger.error(f"Apify batch call failed: {e}")
-        for item in items:
-            if item.status == ItemStatus.RUNNING:
-                scan_service.fail_item(item, str(e))
+        _fail_batch(db, scan_service, job.id, item_map, str(e))
 
     except Exception as e:
         logger.error(f"Batch processing error: {e}", exc_info=True)
-        for item in items:
-            if item.status == ItemStatus.RUNNING:
-                scan_service.fail_item(item, str(e))
+        _fail_batch(db, scan_service, job.id, item_map, str(e))
+
+
+def _failed_item(item_id: int, error_message: str) -> dict:
+    """Build a complete_items mapping for a failed item."""
+    return {"id": item_id, "status": ItemStatus.FAILED, "error_message": error_message}
+
+
+def _fail_batch(db, scan_service: ProductScanService, job_id: int, item_map: dict, error_message: str) -> None:
+    """Fail every item of a batch; nothing was written, as the batch commits once."""
+    db.rollback()
+    scan_service.complete_items(
+        job_id,
+        [_failed_item(item_id, error_message) for item_id, _ in item_map.values()],
+    )
 
 
 # ===== Competitor Scrape Job Processing =====
@@ -534,19 +557,19 @@ def _process_competitor_scrape_job(db, job: CompetitorScrapeJob) -> None:
 
     # Mark job as running
     job.status = "running"
-    job.started_at = datetime.utcnow()
+    job.started_at = func.current_timestamp()
     db.commit()
 
     try:
         # Process pending items in batches
         while True:
-            pending_items = CompetitorService.get_pending_items_for_job(db, job.id)
-            if not pending_items:
+            # Fetch only the next batch instead of every pending item
+            batch = CompetitorService.get_pending_items_for_job(
+                db, job.id, limit=COMPETITOR_BATCH_SIZE
+            )
+            if not batch:
                 break
 
-            # Take only batch size
-            batch = pending_items[:COMPETITOR_BATCH_SIZE]
-
             _process_competitor_batch(
                 db=db,
                 job=job,
@@ -567,7 +590,7 @@ def _process_competitor_scrape_job(db, job: CompetitorScrapeJob) -> None:
             job.status = "failed"
         else:
             job.status = "completed"
-        job.completed_at = datetime.utcnow()
+        job.completed_at = func.current_timestamp()
         db.commit()
 
         logger.info(
@@ -579,7 +602,7 @@ def _process_competitor_scrape_job(db, job: CompetitorScrapeJob) -> None:
         logger.error(f"Competitor scrape job {job.id} failed: {e}", exc_info=True)
         job.status = "failed"
         job.error_message = str(e)
-        job.completed_at = datetime.utcnow()
+        job.completed_at = func.current_timestamp()
         db.commit()
 
 
@@ -601,11 +624,15 @@ def _process_competitor_batch(
     # Mark all items as running
     for item in items:
         item.status = "running"
-        item.started_at = datetime.utcnow()
+        item.started_at = func.current_timestamp()
     db.commit()
 
     logger.info(f"Processing competitor batch of {len(asins)} ASINs for job {job.id}")
 
+    # Scheduled competitors scraped in this batch; their next_scrape_at is
+    # advanced with one UPDATE once the batch ends, even if it fails partway
+    rescheduled_ids = []
+
     try:
         # Call Apify (synchronous version for worker thread)
         results = apify_service.scrape_product_details_sync(
@@ -651,11 +678,11 @@ def _process_competitor_batch(
 
                     # Update next scrape time if scheduled
                     if competitor and competitor.schedule != "none":
-                        CompetitorService.update_next_scrape(db, competitor)
+                        rescheduled_ids.append(competitor.id)
 
                     # Mark item as completed
                     item.status = "completed"
-                    item.completed_at = datetime.utcnow()
+                    item.completed_at = func.current_timestamp()
                     job.completed_competitors += 1
 
                     logger.debug(
@@ -668,7 +695,7 @@ def _process_competitor_batch(
                     error_msg = result.get("statusMessage", f"Status code: {status_code}")
                     item.status = "failed"
                     item.error_message = error_msg
-                    item.completed_at = datetime.utcnow()
+                    item.completed_at = func.current_timestamp()
                     job.failed_competitors += 1
                     logger.warning(f"Competitor {asin} failed: {error_msg}")
 
@@ -676,12 +703,10 @@ def _process_competitor_batch(
                 # No result found for this ASIN
                 item.status = "failed"
                 item.error_message = "No result returned from Apify"
-                item.completed_at = datetime.utcnow()
+                item.completed_at = func.current_timestamp()
                 job.failed_competitors += 1
                 logger.warning(f"Competitor {asin}: No result in Apify response")
 
-        db.commit()
-
     except ApifyError as e:
         # Apify call failed - mark all items as failed
         logger.error(f"Apify competitor batch call failed: {e}")
@@ -689,9 +714,8 @@ def _process_competitor_batch(
             if item.status == "running":
                 item.status = "failed"
                 item.error_message = str(e)
-                item.completed_at = datetime.utcnow()
+                item.completed_at = func.current_timestamp()
                 job.failed_competitors += 1
-        db.commit()
 
     except Exception as e:
         logger.error(f"Competitor batch processing error: {e}", exc_info=True)
@@ -699,8 +723,13 @@ def _process_competitor_batch(
             if item.status == "running":
                 item.status = "failed"
                 item.error_message = str(e)
-                item.completed_at = datetime.utcnow()
+                item.completed_at = func.current_timestamp()
                 job.failed_competitors += 1
+
+    finally:
+        # Competitors already saved (each save commits) must not come due
+        # again, so they are rescheduled on every exit path
+        CompetitorService.bulk_update_next_scrape(db, rescheduled_ids)
         db.commit()
 
 
@@ -0,0 +1,90 @@
+# =============================================================================
+# Amazon Reviews Scraper - Shared Test Fixtures
+# =============================================================================
+# Purpose: In-memory database, API client and SQL query counter
+# Public API: db_engine, client, count_queries fixtures
+# Dependencies: pytest, sqlalchemy, fastapi TestClient
+# =============================================================================
+
+from contextlib import contextmanager
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import BigInteger, create_engine, event
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src import database
+from src.config import settings
+from src.main import app
+
+
+@compiles(BigInteger, "sqlite")
+def _sqlite_bigint(type_, compiler, **kw):
+    """SQLite only autoincrements INTEGER primary keys."""
+    return "INTEGER"
+
+
+@pytest.fixture
+def db_engine():
+    """Fresh in-memory SQLite database with all tables."""
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    database.Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def client(db_engine, monkeypatch):
+    """
+    API client bound to the in-memory database.
+
+    Strict loading is on, so any lazy relationship load outside the
+    declared eager-load options fails the test.
+    """
+    session_factory = sessionmaker(bind=db_engine, autoflush=False)
+
+    def override_get_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    monkeypatch.setattr(database, "SessionLocal", session_factory)
+    monkeypatch.setattr(settings, "strict_loading", True)
+    app.dependency_overrides[database.get_db] = override_get_db
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def count_queries(db_engine):
+    """
+    Context manager recording every SQL statement sent to the database.
+
+    Example:
+        with count_queries() as queries:
+            client.get("/api/jobs")
+        assert len(queries) <= 2
+    """
+
+    @contextmanager
+    def _count():
+        queries = []
+
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            queries.append(statement)
+
+        event.listen(db_engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            yield queries
+        finally:
+            event.remove(db_engine, "before_cursor_execute", before_cursor_execute)
+
+    return _count
@@ -0,0 +1,62 @@
+# =============================================================================
+# Jobs Domain - SQL Query Budget Tests
+# =============================================================================
+# Purpose: Guard job endpoints against N+1 regressions
+# Dependencies: pytest, conftest fixtures
+# =============================================================================
+
+
+def _create_jobs(client, count):
+    for i in range(count):
+        response = client.post(
+            "/api/jobs",
+            json={
+                "job_name": f"Job {i}",
+                "sku_code": f"SKU-{i}",
+                "asins": ["B000000001", "B000000002", "B000000003"],
+            },
+        )
+        assert response.status_code == 201
+
+
+def test_list_jobs_query_budget(client, count_queries):
+    _create_jobs(client, 10)
+
+    with count_queries() as queries:
+        response = client.get("/api/jobs", params={"page_size": 50})
+
+    assert response.status_code == 200
+    assert len(response.json()["items"]) == 10
+    # Page + windowed total in one query, SKUs in one IN query
+    assert len(queries) <= 2
+
+
+def test_get_job_query_budget(client, count_queries):
+    _create_jobs(client, 1)
+
+    with count_queries() as queries:
+        response = client.get("/api/jobs/1")
+
+    assert response.status_code == 200
+    assert len(response.json()["asins"]) == 3
+    # Job, then SKU and ASINs via selectinload
+    assert len(queries) <= 3
+
+
+def test_create_job_query_budget(client, count_queries):
+    with count_queries() as queries:
+        response = client.post(
+            "/api/jobs",
+            json={
+                "job_name": "Budget",
+                "sku_code": "SKU-NEW",
+                "asins": ["B000000001", "B000000002", "B000000003"],
+            },
+        )
+
+    assert response.status_code == 201
+    statements = [q for q in queries if not q.startswith(("BEGIN", "COMMIT"))]
+    # SKU lookup, insert + refresh; job insert; one executemany for the
+    # ASINs; then reloading the job and its SKU for the response
+    assert sum(q.startswith("INSERT INTO job_asin") for q in statements) == 1
+    assert len(statements) <= 7
@@ -0,0 +1,128 @@
+# =============================================================================
+# Amazon Reviews Scraper - Pagination Tests
+# =============================================================================
+# Purpose: Offset pagination, keyset cursor encoding and seek pagination
+# Dependencies: pytest, sqlalchemy (in-memory SQLite)
+# =============================================================================
+
+from datetime import datetime
+
+import pytest
+from sqlalchemy import Column, DateTime, Integer, create_engine, desc, func
+from sqlalchemy.orm import declarative_base, sessionmaker
+
+from src.pagination import _decode_cursor, keyset_cursor, paginate, paginate_keyset
+
+
+Base = declarative_base()
+
+
+class Item(Base):
+    """Minimal table ordered by (created_at, id) like the list endpoints."""
+
+    __tablename__ = "item"
+
+    id = Column(Integer, primary_key=True)
+    created_at = Column(DateTime, nullable=False)
+
+
+ORDER_COLS = (Item.created_at, Item.id)
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+
+    # Pairs of rows share a timestamp so the id tie-break matters
+    session.add_all(
+        Item(id=i, created_at=datetime(2024, 1, 1 + (i - 1) // 2))
+        for i in range(1, 8)
+    )
+    session.commit()
+    yield session
+    session.close()
+
+
+def _query(db):
+    return db.query(Item).order_by(*(desc(col) for col in ORDER_COLS))
+
+
+def test_cursor_round_trip(db):
+    item = db.get(Item, 3)
+    values = _decode_cursor(keyset_cursor(item, ORDER_COLS), ORDER_COLS)
+    assert values == [item.created_at, item.id]
+
+
+def test_pages_follow_tie_break_on_equal_timestamps(db):
+    seen = []
+    items, total, cursor = paginate_keyset(_query(db), ORDER_COLS, None, per_page=3)
+    seen.extend(item.id for item in items)
+    while cursor:
+        items, total, cursor = paginate_keyset(_query(db), ORDER_COLS, cursor, per_page=3)
+        seen.extend(item.id for item in items)
+
+    assert total == 7
+    assert seen == [7, 6, 5, 4, 3, 2, 1]
+
+
+def test_last_page_has_no_next_cursor(db):
+    _, _, cursor = paginate_keyset(_query(db), ORDER_COLS, None, per_page=4)
+    items, _, next_cursor = paginate_keyset(_query(db), ORDER_COLS, cursor, per_page=4)
+
+    assert [item.id for item in items] == [3, 2, 1]
+    assert next_cursor is None
+
+
+def test_exact_final_page_has_no_next_cursor(db):
+    items, _, cursor = paginate_keyset(_query(db), ORDER_COLS, None, per_page=7)
+    assert len(items) == 7
+    assert cursor is None
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not-base64!",
+        "WzFd",  # [1] - wrong number of values
+        "eyJhIjogMX0=",  # {"a": 1} - not a list
+        "WyJub3QtYS1kYXRlIiwgMV0=",  # ["not-a-date", 1]
+    ],
+)
+def test_malformed_cursor_raises_value_error(db, cursor):
+    with pytest.raises(ValueError):
+        paginate_keyset(_query(db), ORDER_COLS, cursor, per_page=3)
+
+
+def test_paginate_returns_page_and_window_total(db):
+    items, total = paginate(_query(db), page=2, per_page=3)
+    assert [item.id for item in items] == [4, 3, 2]
+    assert total == 7
+
+
+def test_paginate_past_the_end_still_reports_total(db):
+    items, total = paginate(_query(db), page=5, per_page=3)
+    assert items == []
+    assert total == 7
+
+
+def test_paginate_keeps_multi_column_rows(db):
+    query = db.query(Item, Item.created_at).order_by(desc(Item.id))
+    items, total = paginate(query, page=1, per_page=2)
+    assert [(item.id, created_at) for item, created_at in items] == [
+        (7, datetime(2024, 1, 4)),
+        (6, datetime(2024, 1, 3)),
+    ]
+    assert total == 7
+
+
+def test_paginate_grouped_query_counts_groups(db):
+    query = (
+        db.query(Item.created_at, func.count(Item.id))
+        .group_by(Item.created_at)
+        .order_by(Item.created_at)
+    )
+    items, total = paginate(query, page=1, per_page=2)
+    assert len(items) == 2
+    assert total == 4
@@ -38,6 +38,7 @@ CREATE TABLE IF NOT EXISTS competitor (
     UNIQUE KEY unique_competitor_asin_marketplace (asin, marketplace),
     INDEX idx_competitor_sku_id (sku_id),
     INDEX idx_competitor_schedule (schedule, next_scrape_at),
+    INDEX idx_competitor_upcoming (is_active, next_scrape_at, schedule, asin, marketplace),
     INDEX idx_competitor_active (is_active),
     INDEX idx_competitor_marketplace (marketplace)
 ) ENGINE=InnoDB;
@@ -196,6 +197,12 @@ CREATE TABLE IF NOT EXISTS competitor_scrape_item (
     INDEX idx_comp_item_competitor (competitor_id)
 ) ENGINE=InnoDB;
 
+-- =============================================================================
+-- Performance Indexes for Existing Tables (Add if not exists)
+-- =============================================================================
+-- Covering index for dashboard upcoming scrapes / due competitor lookups
+-- ALTER TABLE competitor ADD INDEX idx_competitor_upcoming (is_active, next_scrape_at, schedule, asin, marketplace);
+
 -- =============================================================================
 -- End of Migration Script
 -- =============================================================================
@@ -54,8 +54,8 @@ CREATE TABLE IF NOT EXISTS scrape_job (
     completed_at TIMESTAMP NULL,
 
     FOREIGN KEY (sku_id) REFERENCES sku(id) ON DELETE SET NULL,
-    INDEX idx_job_status (status),
-    INDEX idx_job_sku (sku_id),
+    INDEX idx_job_status_created (status, created_at),
+    INDEX idx_job_sku_created (sku_id, created_at),
     INDEX idx_job_created (created_at)
 ) ENGINE=InnoDB;
 
@@ -78,7 +78,7 @@ CREATE TABLE IF NOT EXISTS job_asin (
 
     FOREIGN KEY (job_id) REFERENCES scrape_job(id) ON DELETE CASCADE,
     INDEX idx_job_asin_status (status),
-    INDEX idx_job_asin_job (job_id)
+    INDEX idx_job_asin_job_status (job_id, status)
 ) ENGINE=InnoDB;
 
 -- =============================================================================
@@ -132,6 +132,15 @@ CREATE TABLE IF NOT EXISTS asin_history (
 -- Composite index for worker efficiency (job_asin)
 -- ALTER TABLE job_asin ADD INDEX idx_job_asin_job_status (job_id, status);
 
+-- Composite indexes for job listing filters ordered by created_at (scrape_job)
+-- ALTER TABLE scrape_job ADD INDEX idx_job_status_created (status, created_at);
+-- ALTER TABLE scrape_job ADD INDEX idx_job_sku_created (sku_id, created_at);
+
+-- Composite index for scan job status filters ordered by created_at
+-- (product_scan_job; supersedes the single-column status index)
+-- ALTER TABLE product_scan_job ADD INDEX idx_product_scan_status_created (status, created_at),
+--     DROP INDEX idx_product_scan_status;
+
 -- Review table indexes for large datasets
 -- ALTER TABLE review ADD INDEX idx_review_rating (rating);
 -- ALTER TABLE review ADD INDEX idx_review_date (date);
@@ -197,7 +206,7 @@ CREATE TABLE IF NOT EXISTS product_scan_job (
     started_at TIMESTAMP NULL,
     completed_at TIMESTAMP NULL,
 
-    INDEX idx_product_scan_status (status),
+    INDEX idx_product_scan_status_created (status, created_at),
     INDEX idx_product_scan_created (created_at DESC)
 ) ENGINE=InnoDB;
 